@@ -19,6 +19,7 @@ import {
   WorkflowStatus,
   createExecutionContext,
   createStepResult,
+  countStepStatuses,
 } from '@marktoflow/core';
 
 // Re-export SDKRegistryLike type from engine
@@ -287,12 +288,9 @@ export class WorkflowDebugger {
     console.log(chalk.bold('Current State:'));
     console.log(`  Step: ${this.state.currentStepIndex + 1}/${this.workflow.steps.length}`);
     console.log(`  Variables: ${Object.keys(this.state.context.variables).length}`);
-    console.log(
-      `  Completed: ${this.state.stepResults.filter((r) => r.status === StepStatus.COMPLETED).length}`
-    );
-    console.log(
-      `  Failed: ${this.state.stepResults.filter((r) => r.status === StepStatus.FAILED).length}`
-    );
+    const counts = countStepStatuses(this.state.stepResults);
+    console.log(`  Completed: ${counts.completed}`);
+    console.log(`  Failed: ${counts.failed}`);
   }
 
   /**
@@ -473,11 +471,7 @@ export class WorkflowDebugger {
   private displaySummary(): void {
     console.log(chalk.bold.green('\n✓ Debug session complete\n'));
 
-    const completed = this.state.stepResults.filter(
-      (r) => r.status === StepStatus.COMPLETED
-    ).length;
-    const failed = this.state.stepResults.filter((r) => r.status === StepStatus.FAILED).length;
-    const skipped = this.state.stepResults.filter((r) => r.status === StepStatus.SKIPPED).length;
+    const { completed, failed, skipped } = countStepStatuses(this.state.stepResults);
 
     console.log(chalk.bold('Summary:'));
     console.log(`  Total steps: ${this.workflow.steps.length}`);
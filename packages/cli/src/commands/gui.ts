@@ -38,9 +38,13 @@ export async function executeGui(options: GuiOptions): Promise<void> {
     // Open browser if requested
     if (options.open) {
       const url = `http://localhost:${options.port}`;
-      const { exec } = await import('node:child_process');
+      const { spawn } = await import('node:child_process');
       const openCmd = process.platform === 'darwin' ? 'open' : process.platform === 'win32' ? 'start' : 'xdg-open';
-      exec(`${openCmd} ${url}`);
+      // Nothing reads the opener's output, and a browser it launches can keep
+      // writing for as long as the GUI runs, so discard it instead of buffering
+      const opener = spawn(openCmd, [url], { stdio: 'ignore', shell: process.platform === 'win32' });
+      opener.on('error', () => {});
+      opener.unref();
     }
 
     console.log('\n' + chalk.bold('Marktoflow GUI'));
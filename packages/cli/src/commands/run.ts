@@ -13,6 +13,7 @@ import {
   createSDKStepExecutor,
   StepStatus,
   WorkflowStatus,
+  countStepStatuses,
   loadConfig,
   StateStore,
 } from '@marktoflow/core';
@@ -219,11 +220,9 @@ export async function executeRun(workflowPath: string, options: RunOptions): Pro
     console.log(`  Duration: ${result.duration}ms`);
     console.log(`  Steps: ${result.stepResults.length}`);
 
-    const completed = result.stepResults.filter((s) => s.status === StepStatus.COMPLETED).length;
-    const failed = result.stepResults.filter((s) => s.status === StepStatus.FAILED).length;
-    const skipped = result.stepResults.filter((s) => s.status === StepStatus.SKIPPED).length;
+    const counts = countStepStatuses(result.stepResults);
 
-    console.log(`  Completed: ${completed}, Failed: ${failed}, Skipped: ${skipped}`);
+    console.log(`  Completed: ${counts.completed}, Failed: ${counts.failed}, Skipped: ${counts.skipped}`);
 
     stateStore.close();
     process.exit(0);
@@ -2,7 +2,8 @@
  * Auto-detect available AI agents by checking CLI tools, env vars, and running servers.
  */
 
-import { execSync } from 'node:child_process';
+import { execFileSync, execSync } from 'node:child_process';
+import { accessSync, constants, statSync } from 'node:fs';
 
 export interface DetectedAgent {
   id: string;
@@ -19,15 +20,46 @@ interface AgentSpec {
   configHint: string;
 }
 
+// `which` lookups keyed by command and PATH, so repeated detection
+// doesn't spawn a process per agent once an answer is known.
+const cliCache = new Map<string, boolean>();
+
 function hasCli(command: string): boolean {
+  // An explicit path needs no PATH search: one permission check answers it.
+  if (command.includes('/') || command.includes('\\')) return isExecutableFile(command);
+
+  const key = `${command}\0${process.env.PATH ?? ''}`;
+  const cached = cliCache.get(key);
+  if (cached !== undefined) return cached;
+
+  let found: boolean;
   try {
-    execSync(`which ${command}`, { stdio: 'ignore' });
-    return true;
+    // No shell: the command may come from an environment variable
+    execFileSync('which', [command], { stdio: 'ignore' });
+    found = true;
+  } catch {
+    found = false;
+  }
+  cliCache.set(key, found);
+  return found;
+}
+
+function isExecutableFile(path: string): boolean {
+  try {
+    accessSync(path, constants.X_OK);
+    return statSync(path).isFile();
   } catch {
     return false;
   }
 }
 
+/**
+ * Forget cached CLI lookups (e.g. after installing an agent).
+ */
+export function clearCliCache(): void {
+  cliCache.clear();
+}
+
 function hasEnvVar(name: string): boolean {
   return !!process.env[name];
 }
@@ -77,7 +109,7 @@ const AGENT_SPECS: AgentSpec[] = [
     id: 'copilot',
     name: 'GitHub Copilot',
     detect: () => {
-      if (hasCli('copilot')) return { available: true, method: 'cli' };
+      if (hasCli(process.env.COPILOT_CLI_PATH || 'copilot')) return { available: true, method: 'cli' };
       if (hasEnvVar('GITHUB_TOKEN')) return { available: true, method: 'env' };
       return { available: false, method: 'none' };
     },
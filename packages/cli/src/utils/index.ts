@@ -27,6 +27,7 @@ export {
   detectAgents,
   detectAgent,
   getKnownAgentIds,
+  clearCliCache,
   type DetectedAgent,
 } from './detect-agents.js';
 
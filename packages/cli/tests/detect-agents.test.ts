@@ -1,24 +1,29 @@
 import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
-import { execSync } from 'node:child_process';
+import { execFileSync, execSync } from 'node:child_process';
 
 vi.mock('node:child_process', () => ({
+  execFileSync: vi.fn(),
   execSync: vi.fn(),
 }));
 
+const mockedExecFileSync = vi.mocked(execFileSync);
 const mockedExecSync = vi.mocked(execSync);
 
 // Must import after mock setup
-import { detectAgents, detectAgent, getKnownAgentIds } from '../src/utils/detect-agents.js';
+import { detectAgents, detectAgent, getKnownAgentIds, clearCliCache } from '../src/utils/detect-agents.js';
 
 describe('detect-agents', () => {
   const originalEnv = { ...process.env };
 
   beforeEach(() => {
+    mockedExecFileSync.mockReset();
     mockedExecSync.mockReset();
+    clearCliCache();
     // Clear relevant env vars
     delete process.env.ANTHROPIC_API_KEY;
     delete process.env.OPENAI_API_KEY;
     delete process.env.GITHUB_TOKEN;
+    delete process.env.COPILOT_CLI_PATH;
   });
 
   afterEach(() => {
@@ -31,13 +36,16 @@ describe('detect-agents', () => {
    * The curl call for Ollama server ping is rejected by default.
    */
   function mockCliAvailability(available: string[], ollamaServerUp = false) {
-    mockedExecSync.mockImplementation((cmd: string | URL, _opts?: any) => {
-      const command = String(cmd);
-      if (command.startsWith('which ')) {
-        const binary = command.split(' ')[1];
+    mockedExecFileSync.mockImplementation(((file: string, args?: readonly string[]) => {
+      if (file === 'which' && args?.length === 1) {
+        const binary = args[0];
         if (available.includes(binary)) return Buffer.from(`/usr/bin/${binary}`);
         throw new Error(`not found: ${binary}`);
       }
+      throw new Error(`unexpected command: ${file}`);
+    }) as typeof execFileSync);
+    mockedExecSync.mockImplementation((cmd: string | URL, _opts?: any) => {
+      const command = String(cmd);
       if (command.includes('curl') && command.includes('11434')) {
         if (ollamaServerUp) return Buffer.from('200');
         throw new Error('connection refused');
@@ -46,6 +54,57 @@ describe('detect-agents', () => {
     });
   }
 
+  describe('CLI lookup cache', () => {
+    it('should only run `which` once per command for repeated detection', () => {
+      mockCliAvailability(['claude']);
+      detectAgent('claude-agent');
+      detectAgent('claude-agent');
+      const whichCalls = mockedExecFileSync.mock.calls.filter(
+        ([file, args]) => file === 'which' && args?.[0] === 'claude'
+      );
+      expect(whichCalls).toHaveLength(1);
+    });
+
+    it('should look up again after the cache is cleared', () => {
+      mockCliAvailability([]);
+      expect(detectAgent('codex')?.available).toBe(false);
+      mockCliAvailability(['codex']);
+      clearCliCache();
+      expect(detectAgent('codex')?.available).toBe(true);
+    });
+
+    it('should check an explicit CLI path directly instead of running `which`', () => {
+      mockCliAvailability([]);
+      process.env.COPILOT_CLI_PATH = process.execPath;
+      const result = detectAgent('copilot');
+      expect(result?.available).toBe(true);
+      expect(result?.method).toBe('cli');
+      expect(mockedExecFileSync).not.toHaveBeenCalled();
+    });
+
+    it('should not report a missing explicit CLI path as available', () => {
+      mockCliAvailability([]);
+      process.env.COPILOT_CLI_PATH = '/nonexistent/bin/copilot';
+      expect(detectAgent('copilot')?.available).toBe(false);
+      expect(mockedExecFileSync).not.toHaveBeenCalled();
+    });
+
+    it('should treat a backslash path as explicit instead of running `which`', () => {
+      mockCliAvailability([]);
+      process.env.COPILOT_CLI_PATH = 'C:\\nonexistent\\copilot.exe';
+      expect(detectAgent('copilot')?.available).toBe(false);
+      expect(mockedExecFileSync).not.toHaveBeenCalled();
+    });
+
+    it('should pass a CLI name from the environment to `which` without a shell', () => {
+      mockCliAvailability([]);
+      process.env.COPILOT_CLI_PATH = 'copilot; touch pwned';
+      expect(detectAgent('copilot')?.available).toBe(false);
+      expect(mockedExecFileSync).toHaveBeenCalledWith('which', ['copilot; touch pwned'], { stdio: 'ignore' });
+      expect(mockedExecSync).not.toHaveBeenCalled();
+    });
+  });
+
   describe('getKnownAgentIds', () => {
     it('should return all known agent IDs', () => {
       const ids = getKnownAgentIds();
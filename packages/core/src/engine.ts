@@ -22,6 +22,8 @@ import {
   WorkflowStatus,
   createExecutionContext,
   createStepResult,
+  startTimer,
+  elapsedSince,
   isActionStep,
   isSubWorkflowStep,
   isIfStep,
@@ -253,7 +255,7 @@ export class WorkflowEngine {
   ): Promise<WorkflowResult> {
     const context = createExecutionContext(workflow, inputs);
     const stepResults: StepResult[] = [];
-    const startedAt = new Date();
+    const startedAt = startTimer();
 
     // Store workflow-level permissions and defaults
     this.workflowPermissions = workflow.permissions;
@@ -637,7 +639,7 @@ export class WorkflowEngine {
     sdkRegistry: SDKRegistryLike,
     stepExecutor: StepExecutor,
   ): Promise<StepResult> {
-    const startedAt = new Date();
+    const startedAt = startTimer();
     let lastError: Error | undefined;
 
     const executorContext = this.buildStepExecutorContext(step);
@@ -717,6 +719,10 @@ export class WorkflowEngine {
       this.circuitBreakers.set(serviceName, circuitBreaker);
     }
 
+    // Inputs are resolved once and reused by retries, so a retry replays the
+    // same call instead of reloading the prompt and re-rendering templates
+    let resolvedInputs: Record<string, unknown> | undefined;
+
     for (let attempt = 0; attempt <= maxRetries; attempt++) {
       if (!circuitBreaker.canExecute()) {
         return createStepResult(
@@ -728,12 +734,13 @@ export class WorkflowEngine {
       this.events.onStepStart?.(step, context);
 
       try {
-        let resolvedInputs: Record<string, unknown>;
-        if (step.prompt) {
-          resolvedInputs = await this.loadAndResolvePrompt(step, context);
-          resolvedInputs = resolveTemplates(resolvedInputs, context) as Record<string, unknown>;
-        } else {
-          resolvedInputs = resolveTemplates(step.inputs, context) as Record<string, unknown>;
+        if (!resolvedInputs) {
+          if (step.prompt) {
+            const promptInputs = await this.loadAndResolvePrompt(step, context);
+            resolvedInputs = resolveTemplates(promptInputs, context) as Record<string, unknown>;
+          } else {
+            resolvedInputs = resolveTemplates(step.inputs, context) as Record<string, unknown>;
+          }
         }
 
         const stepWithResolvedInputs = { ...step, inputs: resolvedInputs };
@@ -878,7 +885,7 @@ export class WorkflowEngine {
       error,
       startedAt,
       completedAt,
-      duration: completedAt.getTime() - startedAt.getTime(),
+      duration: elapsedSince(startedAt, completedAt),
     };
   }
 
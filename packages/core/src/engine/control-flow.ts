@@ -10,6 +10,7 @@ import {
   type StepResult,
   StepStatus,
   createStepResult,
+  startTimer,
   type WorkflowStep,
   type IfStep,
   type SwitchStep,
@@ -68,7 +69,7 @@ export async function executeIfStep(
   stepExecutor: StepExecutor,
   dispatch: StepDispatcher,
 ): Promise<StepResult> {
-  const startedAt = new Date();
+  const startedAt = startTimer();
 
   try {
     // Evaluate condition
@@ -122,7 +123,7 @@ export async function executeSwitchStep(
   stepExecutor: StepExecutor,
   dispatch: StepDispatcher,
 ): Promise<StepResult> {
-  const startedAt = new Date();
+  const startedAt = startTimer();
 
   try {
     // Resolve the switch expression
@@ -176,7 +177,7 @@ export async function executeForEachStep(
   stepExecutor: StepExecutor,
   dispatch: StepDispatcher,
 ): Promise<StepResult> {
-  const startedAt = new Date();
+  const startedAt = startTimer();
 
   const cleanupLoopVars = () => {
     delete context.variables[step.itemVariable];
@@ -357,7 +358,7 @@ export async function executeWhileStep(
   stepExecutor: StepExecutor,
   dispatch: StepDispatcher,
 ): Promise<StepResult> {
-  const startedAt = new Date();
+  const startedAt = startTimer();
   let iterations = 0;
 
   try {
@@ -415,7 +416,7 @@ export async function executeMapStep(
   step: MapStep,
   context: ExecutionContext,
 ): Promise<StepResult> {
-  const startedAt = new Date();
+  const startedAt = startTimer();
 
   try {
     // Resolve items array
@@ -462,7 +463,7 @@ export async function executeFilterStep(
   step: FilterStep,
   context: ExecutionContext,
 ): Promise<StepResult> {
-  const startedAt = new Date();
+  const startedAt = startTimer();
 
   try {
     // Resolve items array
@@ -509,7 +510,7 @@ export async function executeReduceStep(
   step: ReduceStep,
   context: ExecutionContext,
 ): Promise<StepResult> {
-  const startedAt = new Date();
+  const startedAt = startTimer();
 
   try {
     // Resolve items array
@@ -566,7 +567,7 @@ export async function executeParallelStep(
   mergeContexts: ContextMerger,
   executeConcurrentlyWithLimit: <T>(promises: Promise<T>[], limit: number) => Promise<T[]>,
 ): Promise<StepResult> {
-  const startedAt = new Date();
+  const startedAt = startTimer();
 
   try {
     // Execute branches in parallel
@@ -630,7 +631,7 @@ export async function executeTryStep(
   stepExecutor: StepExecutor,
   dispatch: StepDispatcher,
 ): Promise<StepResult> {
-  const startedAt = new Date();
+  const startedAt = startTimer();
   let tryError: Error | undefined;
 
   try {
@@ -729,7 +730,7 @@ export async function executeScriptStep(
   step: ScriptStep,
   context: ExecutionContext,
 ): Promise<StepResult> {
-  const startedAt = new Date();
+  const startedAt = startTimer();
 
   try {
     // Resolve any templates in the code
@@ -784,7 +785,7 @@ export async function executeWaitStep(
   context: ExecutionContext,
   stateStore?: StateStore,
 ): Promise<StepResult> {
-  const startedAt = new Date();
+  const startedAt = startTimer();
 
   try {
     switch (step.mode) {
@@ -912,7 +913,7 @@ export async function executeMergeStep(
   step: MergeStep,
   context: ExecutionContext,
 ): Promise<StepResult> {
-  const startedAt = new Date();
+  const startedAt = startTimer();
 
   try {
     // Resolve all source expressions to arrays
@@ -14,9 +14,13 @@ import {
 } from '../models.js';
 import { resolveTemplates } from './variable-resolution.js';
 import { parseFile } from '../parser.js';
+import { parseJsonFromText } from '../utils/json-extract.js';
+import { readFile } from 'node:fs/promises';
 import { resolve, dirname } from 'node:path';
 import type { EngineConfig, SDKRegistryLike, StepExecutor, StepExecutorContext } from './types.js';
 
+const JSON_FENCE_REGEX = /```json\n?([\s\S]*?)```/;
+
 // Forward reference to avoid circular dependency — the engine passes itself
 export type SubWorkflowExecutorFactory = (config: EngineConfig) => {
   execute: (
@@ -91,7 +95,6 @@ export async function executeSubWorkflowWithAgent(
     : resolve(step.workflow);
 
   // Read the workflow file content
-  const { readFile } = await import('node:fs/promises');
   const workflowContent = await readFile(subWorkflowPath, 'utf-8');
 
   // Resolve inputs for the sub-workflow
@@ -228,7 +231,7 @@ ${workflowContent}
 
 ## Inputs
 \`\`\`json
-${JSON.stringify(inputs, null, 2)}
+${JSON.stringify(inputs)}
 \`\`\`
 
 ## Available Tools
@@ -254,6 +257,13 @@ export function parseSubagentResponse(response: unknown): {
   } else if (response && typeof response === 'object') {
     const resp = response as Record<string, unknown>;
 
+    // Already-structured replies (e.g. Agent SDK structuredOutput) need no
+    // text extraction or JSON parsing at all
+    const structured = (resp.structuredOutput ?? resp) as Record<string, unknown> | null;
+    if (structured && typeof structured === 'object' && typeof structured.completed === 'boolean') {
+      return toSubagentResult(structured);
+    }
+
     // OpenAI-style response
     if (resp.choices && Array.isArray(resp.choices)) {
       const choice = resp.choices[0] as Record<string, unknown>;
@@ -283,39 +293,53 @@ export function parseSubagentResponse(response: unknown): {
     return { completed: false, message: 'No content in response' };
   }
 
-  // Try to parse JSON from the response
-  const jsonMatch = content.match(/```json\n?([\s\S]*?)```/);
+  // Fast path: structured replies are usually the bare JSON object, so parse
+  // it directly and only scan for a fenced block when that fails.
+  const trimmed = content.trim();
+  if (trimmed.startsWith('{')) {
+    try {
+      const parsed = JSON.parse(trimmed) as Record<string, unknown>;
+      if (typeof parsed.completed === 'boolean') {
+        return toSubagentResult(parsed);
+      }
+    } catch {
+      // Not a bare JSON object - fall through to fenced-block extraction
+    }
+  }
+
+  // Try to parse a fenced JSON block from the response
+  const jsonMatch = JSON_FENCE_REGEX.exec(content);
   if (jsonMatch) {
     try {
-      const parsed = JSON.parse(jsonMatch[1]) as Record<string, unknown>;
-      const output = parsed.output as Record<string, unknown> | undefined;
-      const error = parsed.error as string | undefined;
-      return {
-        completed: parsed.completed === true,
-        ...(output !== undefined ? { output } : {}),
-        ...(error !== undefined ? { error } : {}),
-      };
+      return toSubagentResult(JSON.parse(jsonMatch[1]) as Record<string, unknown>);
     } catch (e) {
       console.warn('[marktoflow] Failed to parse JSON block in sub-agent response:', (e as Error).message);
     }
   }
 
-  // Try to parse raw JSON
-  try {
-    const parsed = JSON.parse(content) as Record<string, unknown>;
-    if (typeof parsed.completed === 'boolean') {
-      const output = parsed.output as Record<string, unknown> | undefined;
-      const error = parsed.error as string | undefined;
-      return {
-        completed: parsed.completed,
-        ...(output !== undefined ? { output } : {}),
-        ...(error !== undefined ? { error } : {}),
-      };
-    }
-  } catch (e) {
-    console.warn('[marktoflow] Sub-agent response is not valid JSON:', (e as Error).message);
+  // Last resort: an unfenced JSON object embedded in prose
+  const embedded = parseJsonFromText(content) as Record<string, unknown> | undefined;
+  if (embedded && typeof embedded.completed === 'boolean') {
+    return toSubagentResult(embedded);
   }
 
   // Return the content as a message
   return { completed: false, message: content };
 }
+
+/**
+ * Normalize a parsed sub-agent JSON payload into a completion result.
+ */
+function toSubagentResult(parsed: Record<string, unknown>): {
+  completed: boolean;
+  output?: Record<string, unknown>;
+  error?: string;
+} {
+  const output = parsed.output as Record<string, unknown> | undefined;
+  const error = parsed.error as string | undefined;
+  return {
+    completed: parsed.completed === true,
+    ...(output !== undefined ? { output } : {}),
+    ...(error !== undefined ? { error } : {}),
+  };
+}
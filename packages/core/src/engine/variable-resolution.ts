@@ -6,7 +6,7 @@
  */
 
 import type { ExecutionContext } from '../models.js';
-import { renderTemplate } from '../template-engine.js';
+import { hasTemplateSyntax, renderTemplate } from '../template-engine.js';
 
 /**
  * Resolve template variables in a value.
@@ -19,6 +19,11 @@ import { renderTemplate } from '../template-engine.js';
  */
 export function resolveTemplates(value: unknown, context: ExecutionContext): unknown {
   if (typeof value === 'string') {
+    // Static strings resolve to themselves; skip building the context
+    if (!hasTemplateSyntax(value)) {
+      return value;
+    }
+
     // Build the template context with all available variables
     // Spread inputs first, then variables (variables override inputs if same key)
     // Also keep inputs accessible via inputs.* for explicit access
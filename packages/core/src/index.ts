@@ -48,6 +48,9 @@ export {
   // Helpers
   createExecutionContext,
   createStepResult,
+  countStepStatuses,
+  startTimer,
+  elapsedSince,
 } from './models.js';
 
 // Env
@@ -150,6 +153,7 @@ export { evaluateConditions, evaluateCondition } from './engine/conditions.js';
 // Utilities
 export { parseDuration } from './utils/duration.js';
 export { errorToString, toError } from './utils/errors.js';
+export { extractJsonText, parseJsonFromText } from './utils/json-extract.js';
 
 // Permissions
 export {
@@ -438,6 +442,7 @@ export {
 // Template Engine (Nunjucks-based)
 export {
   renderTemplate,
+  hasTemplateSyntax,
   nunjucksEnv,
 } from './template-engine.js';
 
@@ -4,10 +4,10 @@
  * Handles loading and connection to MCP servers (both native/in-memory and stdio).
  */
 
-import { Client } from "@modelcontextprotocol/sdk/client/index.js";
-import { InMemoryTransport } from "@modelcontextprotocol/sdk/inMemory.js";
-import { StdioClientTransport } from "@modelcontextprotocol/sdk/client/stdio.js";
-import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
+// The MCP SDK is imported on first connect: this module is re-exported from
+// the package root, and workflows without MCP tools shouldn't pay to load it
+import type { Client } from "@modelcontextprotocol/sdk/client/index.js";
+import type { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
 import { ToolConfig } from "./models.js";
 
 // Interface for Native MCP Modules
@@ -36,6 +36,11 @@ export class McpLoader {
     // Create the server instance
     const server: McpServer = await module.createMcpServer(config.options || {});
     
+    const [{ Client }, { InMemoryTransport }] = await Promise.all([
+      import("@modelcontextprotocol/sdk/client/index.js"),
+      import("@modelcontextprotocol/sdk/inMemory.js"),
+    ]);
+
     // Create linked in-memory transports
     const [clientTransport, serverTransport] = InMemoryTransport.createLinkedPair();
 
@@ -71,6 +76,11 @@ export class McpLoader {
    * Connect to an external MCP server via Stdio.
    */
   async connectStdio(command: string, args: string[]): Promise<Client> {
+    const [{ Client }, { StdioClientTransport }] = await Promise.all([
+      import("@modelcontextprotocol/sdk/client/index.js"),
+      import("@modelcontextprotocol/sdk/client/stdio.js"),
+    ]);
+
     const transport = new StdioClientTransport({
       command,
       args,
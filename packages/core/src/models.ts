@@ -537,6 +537,50 @@ export function createExecutionContext(
   };
 }
 
+/**
+ * Count step results by status in a single pass.
+ */
+export function countStepStatuses(results: readonly StepResult[]): Record<StepStatus, number> {
+  const counts: Record<StepStatus, number> = {
+    pending: 0,
+    running: 0,
+    completed: 0,
+    failed: 0,
+    skipped: 0,
+  };
+  for (const result of results) {
+    counts[result.status]++;
+  }
+  return counts;
+}
+
+// Monotonic readings for start times captured with startTimer(), so
+// durations are unaffected by wall-clock adjustments during a run.
+const monotonicStarts = new WeakMap<Date, number>();
+
+/**
+ * Capture a step or workflow start time.
+ * Returns the wall-clock Date used for reporting and remembers a monotonic
+ * reading alongside it for duration measurement.
+ */
+export function startTimer(): Date {
+  const startedAt = new Date();
+  monotonicStarts.set(startedAt, performance.now());
+  return startedAt;
+}
+
+/**
+ * Milliseconds elapsed since startedAt. Uses the monotonic clock when the
+ * start was captured with startTimer(), otherwise the wall-clock difference.
+ */
+export function elapsedSince(startedAt: Date, completedAt: Date): number {
+  const monotonicStart = monotonicStarts.get(startedAt);
+  if (monotonicStart !== undefined) {
+    return Math.round(performance.now() - monotonicStart);
+  }
+  return completedAt.getTime() - startedAt.getTime();
+}
+
 export function createStepResult(
   stepId: string,
   status: StepStatus,
@@ -553,7 +597,7 @@ export function createStepResult(
     error,
     startedAt,
     completedAt,
-    duration: completedAt.getTime() - startedAt.getTime(),
+    duration: elapsedSince(startedAt, completedAt),
     retryCount,
   };
 }
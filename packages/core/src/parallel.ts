@@ -6,7 +6,7 @@
  * - parallel.map: Map a function over a collection with parallel agent execution
  */
 
-import { ExecutionContext, WorkflowStep } from './models.js';
+import { ExecutionContext, WorkflowStep, elapsedSince, startTimer } from './models.js';
 import { resolveTemplates } from './engine/variable-resolution.js';
 import type { StepExecutorContext, SDKRegistryLike } from './engine/types.js';
 
@@ -93,8 +93,8 @@ async function executeAgent(
   stepExecutor: (step: WorkflowStep, context: ExecutionContext, sdkRegistry: SDKRegistryLike, executorContext?: StepExecutorContext) => Promise<unknown>,
   timeoutMs: number
 ): Promise<AgentResult> {
-  const started = new Date().toISOString();
-  const startTime = Date.now();
+  const startedAt = startTimer();
+  const started = startedAt.toISOString();
 
   try {
     // Resolve templates in agent inputs and prompt
@@ -133,8 +133,9 @@ async function executeAgent(
       ),
     ]);
 
-    const completed = new Date().toISOString();
-    const duration = Date.now() - startTime;
+    const completedAt = new Date();
+    const completed = completedAt.toISOString();
+    const duration = elapsedSince(startedAt, completedAt);
 
     return {
       id: agentConfig.id,
@@ -148,8 +149,9 @@ async function executeAgent(
       cost: 0, // TODO: Extract cost from result if available
     };
   } catch (error) {
-    const completed = new Date().toISOString();
-    const duration = Date.now() - startTime;
+    const completedAt = new Date();
+    const completed = completedAt.toISOString();
+    const duration = elapsedSince(startedAt, completedAt);
 
     return {
       id: agentConfig.id,
@@ -231,8 +233,8 @@ export async function executeParallelSpawn(
   }
 
   const timeoutMs = parseTimeout(timeout);
-  const started = new Date().toISOString();
-  const startTime = Date.now();
+  const startedAt = startTimer();
+  const started = startedAt.toISOString();
 
   // Execute all agents concurrently
   const agentPromises = agents.map((agent) =>
@@ -270,8 +272,9 @@ export async function executeParallelSpawn(
     // They will complete in the background but we won't wait
   }
 
-  const completed = new Date().toISOString();
-  const duration = Date.now() - startTime;
+  const completedAt = new Date();
+  const completed = completedAt.toISOString();
+  const duration = elapsedSince(startedAt, completedAt);
 
   // Calculate successful/failed agents
   const successful = Object.keys(results).filter((id) => results[id].success);
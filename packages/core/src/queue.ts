@@ -62,8 +62,8 @@ export abstract class MessageQueue extends EventEmitter {
   abstract disconnect(): Promise<void>;
   abstract publish(message: QueueMessage, queueName?: string): Promise<string>;
   abstract consume(handler: MessageHandler, queueName?: string, batchSize?: number): Promise<void>;
-  abstract acknowledge(messageId: string): Promise<void>;
-  abstract reject(messageId: string, requeue?: boolean): Promise<void>;
+  abstract acknowledge(messageId: string, queueName?: string): Promise<void>;
+  abstract reject(messageId: string, requeue?: boolean, queueName?: string): Promise<void>;
   abstract getQueueLength(queueName?: string): Promise<number>;
   abstract purge(queueName?: string): Promise<number>;
   abstract stop(): Promise<void>;
@@ -257,38 +257,43 @@ export class RedisQueue extends MessageQueue {
 
         try {
           await handler(message);
-          await this.acknowledge(message.id);
+          await this.acknowledge(message.id, queueName);
         } catch (error) {
           message.error = String(error);
-          await this.reject(message.id, message.attempts < message.maxAttempts);
+          // Requeue the copy already in hand instead of re-reading and
+          // re-parsing it from the processing hash
+          await this.client.hdel(procKey, message.id);
+          await this.retryOrDeadLetter(message, message.attempts < message.maxAttempts, queueName);
         }
       }
     }
   }
 
-  async acknowledge(messageId: string): Promise<void> {
+  async acknowledge(messageId: string, queueName?: string): Promise<void> {
     if (!this.client) throw new Error("Redis not connected");
-    const procKey = this.processingKey();
+    const procKey = this.processingKey(queueName);
     await this.client.hdel(procKey, messageId);
   }
 
-  async reject(messageId: string, requeue = true): Promise<void> {
+  async reject(messageId: string, requeue = true, queueName?: string): Promise<void> {
     if (!this.client) throw new Error("Redis not connected");
-    const procKey = this.processingKey();
+    const procKey = this.processingKey(queueName);
     const msgJson = await this.client.hget(procKey, messageId);
     
     if (msgJson) {
       await this.client.hdel(procKey, messageId);
-      const message: QueueMessage = JSON.parse(msgJson);
-      
-      if (requeue) {
-        message.status = MessageStatus.PENDING;
-        await new Promise(r => setTimeout(r, (this.config.retryDelay || 5) * 1000));
-        await this.publish(message);
-      } else if (this.config.deadLetterQueue) {
-        message.status = MessageStatus.DEAD_LETTER;
-        await this.publish(message, this.config.deadLetterQueue);
-      }
+      await this.retryOrDeadLetter(JSON.parse(msgJson) as QueueMessage, requeue, queueName);
+    }
+  }
+
+  private async retryOrDeadLetter(message: QueueMessage, requeue: boolean, queueName?: string): Promise<void> {
+    if (requeue) {
+      message.status = MessageStatus.PENDING;
+      await new Promise(r => setTimeout(r, (this.config.retryDelay || 5) * 1000));
+      await this.publish(message, queueName);
+    } else if (this.config.deadLetterQueue) {
+      message.status = MessageStatus.DEAD_LETTER;
+      await this.publish(message, this.config.deadLetterQueue);
     }
   }
 
@@ -144,7 +144,7 @@ export class RollbackRegistry {
   }
 
   rollbackAll(context: Record<string, unknown> = {}, stopOnError: boolean = false): RollbackResult {
-    const start = Date.now();
+    const start = performance.now();
     const errors: string[] = [];
     let rolledBack = 0;
     let failed = 0;
@@ -185,12 +185,12 @@ export class RollbackRegistry {
       stepsFailed: failed,
       stepsSkipped: skipped,
       errors,
-      durationSeconds: (Date.now() - start) / 1000,
+      durationSeconds: (performance.now() - start) / 1000,
     };
   }
 
   async rollbackAllAsync(context: Record<string, unknown> = {}, stopOnError: boolean = false): Promise<RollbackResult> {
-    const start = Date.now();
+    const start = performance.now();
     const errors: string[] = [];
     let rolledBack = 0;
     let failed = 0;
@@ -231,7 +231,7 @@ export class RollbackRegistry {
       stepsFailed: failed,
       stepsSkipped: skipped,
       errors,
-      durationSeconds: (Date.now() - start) / 1000,
+      durationSeconds: (performance.now() - start) / 1000,
     };
   }
 
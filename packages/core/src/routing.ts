@@ -162,17 +162,25 @@ export class AgentSelector {
     for (const cap of required) {
       if (!profile.capabilities.has(cap)) return 0;
     }
-    const extra = Array.from(profile.capabilities).filter((c) => !required.has(c)).length;
+    // Every required capability is present, so the rest are extras
+    const extra = profile.capabilities.size - required.size;
     return Math.min(1, 1 + extra * 0.05);
   }
 
-  private costScore(profile: AgentProfile, all: AgentProfile[]): number {
-    if (all.length === 0) return 1;
-    const costs = all.map((p) => p.costPer1kTokens);
-    const min = Math.min(...costs);
-    const max = Math.max(...costs);
-    if (max === min) return 1;
-    const normalized = (profile.costPer1kTokens - min) / (max - min);
+  private costRange(profiles: AgentProfile[]): { min: number; max: number } | undefined {
+    if (profiles.length === 0) return undefined;
+    let min = Infinity;
+    let max = -Infinity;
+    for (const p of profiles) {
+      if (p.costPer1kTokens < min) min = p.costPer1kTokens;
+      if (p.costPer1kTokens > max) max = p.costPer1kTokens;
+    }
+    return { min, max };
+  }
+
+  private costScore(profile: AgentProfile, range: { min: number; max: number } | undefined): number {
+    if (!range || range.max === range.min) return 1;
+    const normalized = (profile.costPer1kTokens - range.min) / (range.max - range.min);
     return 1 - normalized;
   }
 
@@ -193,12 +201,23 @@ export class AgentSelector {
   }
 
   scoreAgent(profile: AgentProfile, context: RoutingContext): AgentScore {
-    const eligible = this.listProfiles().filter((p) => p.enabled);
+    return this.scoreWithCostRange(profile, context, this.enabledCostRange());
+  }
+
+  private enabledCostRange(): { min: number; max: number } | undefined {
+    return this.costRange(this.listProfiles().filter((p) => p.enabled));
+  }
+
+  private scoreWithCostRange(
+    profile: AgentProfile,
+    context: RoutingContext,
+    range: { min: number; max: number } | undefined
+  ): AgentScore {
     const required = context.requiredCapabilities ?? new Set<string>();
     const score: AgentScore = {
       agentName: profile.name,
       capabilityScore: this.capabilityScore(profile, required),
-      costScore: this.costScore(profile, eligible),
+      costScore: this.costScore(profile, range),
       qualityScore: (profile.accuracyScore + profile.reliabilityScore + profile.speedScore) / 3,
       availabilityScore: this.availabilityScore(profile),
       loadScore: this.loadScore(profile),
@@ -219,9 +238,11 @@ export class AgentSelector {
       return { decision: RoutingDecision.REJECT, fallbackAgents: [], reason: 'No eligible agents', scores: {} };
     }
 
+    // Cost normalization depends only on the enabled pool; compute it once
+    const range = this.enabledCostRange();
     const scores: Record<string, AgentScore> = {};
     for (const profile of eligible) {
-      scores[profile.name] = this.scoreAgent(profile, context);
+      scores[profile.name] = this.scoreWithCostRange(profile, context, range);
     }
 
     const selected = this.selectByStrategy(eligible, scores);
@@ -74,19 +74,24 @@ export class ScriptTool {
         env
       });
 
-      let stdout = '';
-      let stderr = '';
+      // Keep raw chunks and decode once; scripts often emit large JSON
+      // payloads and per-chunk toString() can split multi-byte characters.
+      const stdoutChunks: Buffer[] = [];
+      const stderrChunks: Buffer[] = [];
+      const decode = (chunks: Buffer[]) => Buffer.concat(chunks).toString('utf8');
 
-      proc.stdout.on('data', d => stdout += d.toString());
-      proc.stderr.on('data', d => stderr += d.toString());
+      proc.stdout.on('data', (d: Buffer) => stdoutChunks.push(d));
+      proc.stderr.on('data', (d: Buffer) => stderrChunks.push(d));
 
       const timer = setTimeout(() => {
         proc.kill();
-        reject(new Error(`Script timed out after ${timeout}ms\nSTDOUT: ${stdout}\nSTDERR: ${stderr}`));
+        reject(new Error(`Script timed out after ${timeout}ms\nSTDOUT: ${decode(stdoutChunks)}\nSTDERR: ${decode(stderrChunks)}`));
       }, timeout);
 
       proc.on('close', code => {
         clearTimeout(timer);
+        const stdout = decode(stdoutChunks);
+        const stderr = decode(stderrChunks);
         if (code === 0) {
           const output = stdout.trim();
           if (!output) {
@@ -7,7 +7,7 @@
 
 import { ToolConfig } from './models.js';
 import { McpLoader } from './mcp-loader.js';
-import { Client } from '@modelcontextprotocol/sdk/client/index.js';
+import type { Client } from '@modelcontextprotocol/sdk/client/index.js';
 import { SecretManager } from './secret-providers/secret-manager.js';
 
 // ============================================================================
@@ -287,20 +287,22 @@ export class SDKRegistry {
       return config;
     }
 
-    const resolvedAuth: Record<string, string> = {};
+    const secretManager = this.secretManager;
 
-    for (const [key, value] of Object.entries(config.auth)) {
-      if (typeof value === 'string' && SecretManager.isSecretReference(value)) {
-        // Resolve secret reference
-        resolvedAuth[key] = await this.secretManager.resolveSecrets(value);
-      } else {
-        resolvedAuth[key] = value;
-      }
-    }
+    // Secret references are independent, so resolve them concurrently rather
+    // than paying one provider round trip per key.
+    const entries = await Promise.all(
+      Object.entries(config.auth).map(async ([key, value]): Promise<[string, string]> => {
+        if (typeof value === 'string' && SecretManager.isSecretReference(value)) {
+          return [key, await secretManager.resolveSecrets(value)];
+        }
+        return [key, value];
+      })
+    );
 
     return {
       ...config,
-      auth: resolvedAuth,
+      auth: Object.fromEntries(entries),
     };
   }
 
@@ -32,10 +32,37 @@ const env = new nunjucks.Environment(null, {
 // Register all custom filters
 registerFilters(env);
 
+// Compiled templates keyed by source. Step inputs are re-rendered with the
+// same source on every retry, loop iteration and fan-out branch, so compile
+// once and render against each new context.
+const TEMPLATE_CACHE_SIZE = 500;
+const templateCache = new Map<string, nunjucks.Template>();
+
+function renderString(source: string, context: Record<string, unknown>): string {
+  let compiled = templateCache.get(source);
+  if (!compiled) {
+    compiled = new nunjucks.Template(source, env, undefined, true);
+    if (templateCache.size >= TEMPLATE_CACHE_SIZE) {
+      // Evict the oldest entry (Map iterates in insertion order)
+      templateCache.delete(templateCache.keys().next().value!);
+    }
+    templateCache.set(source, compiled);
+  }
+  return compiled.render(context);
+}
+
 // ============================================================================
 // Template Resolution
 // ============================================================================
 
+/**
+ * Whether a string contains any Nunjucks delimiter ({{, {% or {#).
+ * Strings without one render to themselves, so callers can skip rendering.
+ */
+export function hasTemplateSyntax(value: string): boolean {
+  return value.includes('{{') || value.includes('{%') || value.includes('{#');
+}
+
 /**
  * Render a template string with context.
  *
@@ -70,6 +97,11 @@ export function renderTemplate(
   template: string,
   context: Record<string, unknown>
 ): unknown {
+  // Static text needs no parse
+  if (!hasTemplateSyntax(template)) {
+    return template;
+  }
+
   // Check if the entire string is a single template expression
   // Handle nested braces in object literals like {{ foo | merge({a: 1}) }}
   const trimmed = template.trim();
@@ -104,7 +136,7 @@ export function renderTemplate(
 
   // String with multiple expressions, control flow, or plain text - render as string
   try {
-    return env.renderString(template, context);
+    return renderString(template, context);
   } catch (error) {
     // If rendering fails, return the original template
     console.error('Template render error:', error);
@@ -146,7 +178,7 @@ function evaluateExpression(expression: string, context: Record<string, unknown>
     // Has filters or complex expression - use Nunjucks with JSON serialization
     // to preserve the actual type
     const wrappedTemplate = `{{ ${expression} | to_json }}`;
-    const jsonResult = env.renderString(wrappedTemplate, context);
+    const jsonResult = renderString(wrappedTemplate, context);
 
     // Parse JSON to get the actual type
     try {
@@ -155,7 +187,7 @@ function evaluateExpression(expression: string, context: Record<string, unknown>
     } catch {
       // Not valid JSON (e.g., undefined, function result)
       // Try direct rendering and return the string result
-      const directResult = env.renderString(`{{ ${expression} }}`, context);
+      const directResult = renderString(`{{ ${expression} }}`, context);
       return directResult || '';
     }
   } catch (error) {
@@ -15,7 +15,9 @@ type McpToolSpec = {
 };
 
 export class MCPTool extends Tool {
-  private operations: Record<string, McpToolSpec> = {};
+  // Map, not a plain object: lookups must not match inherited keys such as
+  // "constructor", which would forward unknown names to the MCP server
+  private operations = new Map<string, McpToolSpec>();
   private client: any = null;
   private loader = new McpLoader();
 
@@ -32,18 +34,18 @@ export class MCPTool extends Tool {
       // The MCP SDK returns { tools: [...] } not just an array
       const toolsArray = Array.isArray(toolsResponse) ? toolsResponse : toolsResponse?.tools ?? [];
       for (const tool of toolsArray) {
-        this.operations[tool.name] = {
+        this.operations.set(tool.name, {
           name: tool.name,
           description: tool.description,
           input_schema: tool.inputSchema ?? tool.input_schema ?? {},
-        };
+        });
       }
       this.client = client;
     } else if (this.implementation.specPath) {
       const content = readFileSync(this.implementation.specPath, 'utf8');
       const data = parse(content) as { tools?: McpToolSpec[] };
       for (const tool of data.tools ?? []) {
-        this.operations[tool.name] = tool;
+        this.operations.set(tool.name, tool);
       }
     }
     this.initialized = true;
@@ -51,7 +53,7 @@ export class MCPTool extends Tool {
 
   async execute(operation: string, params: Record<string, unknown>): Promise<unknown> {
     if (!this.initialized) await this.initialize();
-    if (!this.operations[operation]) {
+    if (!this.operations.has(operation)) {
       throw new Error(`Unknown MCP operation: ${operation}`);
     }
     if (!this.client) {
@@ -64,11 +66,11 @@ export class MCPTool extends Tool {
   }
 
   listOperations(): string[] {
-    return Object.keys(this.operations);
+    return [...this.operations.keys()];
   }
 
   getOperationSchema(operation: string): Record<string, unknown> {
-    const op = this.operations[operation];
+    const op = this.operations.get(operation);
     if (!op) return {};
     return {
       description: op.description ?? '',
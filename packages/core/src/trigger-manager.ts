@@ -124,11 +124,16 @@ export class TriggerManager {
 
   async stop(): Promise<void> {
     this.scheduler.stop();
-    for (const watcher of this.fileWatchers.values()) {
-      await watcher.stop();
-    }
-    if (this.webhookReceiver.isRunning()) {
-      await this.webhookReceiver.stop();
+    // Watchers and the webhook server shut down independently, so stop them
+    // together; one failing to close must not leave the others running
+    const results = await Promise.allSettled([
+      ...Array.from(this.fileWatchers.values(), (watcher) => watcher.stop()),
+      this.webhookReceiver.stop(),
+    ]);
+    for (const result of results) {
+      if (result.status === 'rejected') {
+        console.error('[marktoflow] Failed to stop trigger:', result.reason);
+      }
     }
   }
 
@@ -1,2 +1,3 @@
 export { parseDuration } from './duration.js';
 export { errorToString, toError } from './errors.js';
+export { extractJsonText, parseJsonFromText } from './json-extract.js';
@@ -0,0 +1,106 @@
+/**
+ * JSON extraction utility for marktoflow.
+ *
+ * Finds JSON embedded in free-form text such as LLM replies, where the
+ * payload may be surrounded by prose or followed by further braces.
+ */
+
+const QUOTE = 0x22; // "
+const BACKSLASH = 0x5c; // \
+const OPEN_BRACE = 0x7b; // {
+const CLOSE_BRACE = 0x7d; // }
+const OPEN_BRACKET = 0x5b; // [
+const CLOSE_BRACKET = 0x5d; // ]
+
+/**
+ * Extract the first balanced JSON object or array from a string.
+ *
+ * Scans once from the first opening delimiter, tracking nesting depth and
+ * string/escape state so braces inside string values are not counted. Unlike
+ * a greedy /\{[\s\S]*\}/ match, this stops at the matching close and stays
+ * linear on large inputs.
+ *
+ * @param text - Text that may contain JSON
+ * @param openers - Delimiters that may start the value: '{', '[' or '{['
+ * @returns The JSON substring, or undefined if none is balanced
+ */
+export function extractJsonText(text: string, openers: '{' | '[' | '{[' = '{'): string | undefined {
+  const start = nextOpener(text, openers, 0);
+  if (start === -1) return undefined;
+
+  const end = balancedEnd(text, start);
+  return end === -1 ? undefined : text.slice(start, end);
+}
+
+/**
+ * Parse the first valid JSON object or array embedded in a string.
+ *
+ * Like extractJsonText, but when a span is not valid JSON (e.g. a
+ * "{placeholder}" or a lone "{" in surrounding prose) scanning resumes at the
+ * next opening delimiter instead of giving up.
+ *
+ * @param text - Text that may contain JSON
+ * @param openers - Delimiters that may start the value: '{', '[' or '{['
+ * @returns The parsed value, or undefined if no candidate parses
+ */
+export function parseJsonFromText(text: string, openers: '{' | '[' | '{[' = '{'): unknown {
+  let start = nextOpener(text, openers, 0);
+  while (start !== -1) {
+    const end = balancedEnd(text, start);
+    // A stray opener in the prose never closes; the payload may still follow it
+    if (end !== -1) {
+      try {
+        return JSON.parse(text.slice(start, end));
+      } catch {
+        // Not JSON - try the next candidate
+      }
+    }
+    start = nextOpener(text, openers, start + 1);
+  }
+  return undefined;
+}
+
+/**
+ * Index just past the delimiter that closes the value opened at `start`,
+ * or -1 if it is never closed.
+ */
+function balancedEnd(text: string, start: number): number {
+  let depth = 0;
+  let inString = false;
+  let escaped = false;
+
+  for (let i = start; i < text.length; i++) {
+    const ch = text.charCodeAt(i);
+
+    if (inString) {
+      if (escaped) {
+        escaped = false;
+      } else if (ch === BACKSLASH) {
+        escaped = true;
+      } else if (ch === QUOTE) {
+        inString = false;
+      }
+      continue;
+    }
+
+    if (ch === QUOTE) {
+      inString = true;
+    } else if (ch === OPEN_BRACE || ch === OPEN_BRACKET) {
+      depth++;
+    } else if (ch === CLOSE_BRACE || ch === CLOSE_BRACKET) {
+      depth--;
+      if (depth === 0) return i + 1;
+    }
+  }
+
+  return -1;
+}
+
+function nextOpener(text: string, openers: string, from: number): number {
+  let first = -1;
+  for (const opener of openers) {
+    const index = text.indexOf(opener, from);
+    if (index !== -1 && (first === -1 || index < first)) first = index;
+  }
+  return first;
+}
@@ -116,6 +116,9 @@ export function generateSignature(payload: string, secret: string): string {
 // WebhookReceiver Implementation
 // ============================================================================
 
+// How long stop() waits for open connections to finish before dropping them
+const STOP_TIMEOUT_MS = 5_000;
+
 export class WebhookReceiver {
   private server: Server | null = null;
   private endpoints: Map<string, WebhookEndpoint> = new Map();
@@ -175,19 +178,25 @@ export class WebhookReceiver {
 
   /**
    * Stop the webhook server.
+   *
+   * Safe to call more than once. Connections still open after
+   * STOP_TIMEOUT_MS are closed forcibly so shutdown cannot hang on a
+   * lingering keep-alive client.
    */
   async stop(): Promise<void> {
+    const server = this.server;
+    if (!server) return;
+    this.server = null;
+
     return new Promise((resolve, reject) => {
-      if (!this.server) {
-        resolve();
-        return;
-      }
+      const forceClose = setTimeout(() => server.closeAllConnections(), STOP_TIMEOUT_MS);
+      forceClose.unref();
 
-      this.server.close((error) => {
+      server.close((error) => {
+        clearTimeout(forceClose);
         if (error) {
           reject(error);
         } else {
-          this.server = null;
           resolve();
         }
       });
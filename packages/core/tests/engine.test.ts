@@ -1,6 +1,13 @@
 import { describe, it, expect, vi } from 'vitest';
 import { WorkflowEngine, RetryPolicy, CircuitBreaker, resolveTemplates } from '../src/engine.js';
-import { Workflow, WorkflowStatus, StepStatus, ExecutionContext } from '../src/models.js';
+import {
+  Workflow,
+  WorkflowStatus,
+  StepStatus,
+  ExecutionContext,
+  createStepResult,
+  countStepStatuses,
+} from '../src/models.js';
 import { SDKRegistry } from '../src/sdk-registry.js';
 
 describe('RetryPolicy', () => {
@@ -239,6 +246,30 @@ describe('WorkflowEngine', () => {
     expect(executor).toHaveBeenCalledTimes(3);
   });
 
+  it('should reuse resolved inputs across retries', async () => {
+    const workflow = createMockWorkflow([
+      { id: 'step1', action: 'test.action', inputs: { name: '{{ inputs.name }}' } },
+    ]);
+
+    const engine = new WorkflowEngine({ maxRetries: 1, retryBaseDelay: 10 });
+    const registry = createMockSDKRegistry();
+    const seen: unknown[] = [];
+    const executor = vi.fn().mockImplementation(async (step, context: ExecutionContext) => {
+      seen.push(step.inputs);
+      if (seen.length === 1) {
+        context.inputs.name = 'changed';
+        throw new Error('Fail once');
+      }
+      return { success: true };
+    });
+
+    const result = await engine.execute(workflow, { name: 'original' }, registry, executor);
+
+    expect(result.status).toBe(WorkflowStatus.COMPLETED);
+    expect(seen).toEqual([{ name: 'original' }, { name: 'original' }]);
+    expect(seen[1]).toBe(seen[0]);
+  });
+
   it('should fail after max retries', async () => {
     const workflow = createMockWorkflow([{ id: 'step1', action: 'test.action', inputs: {} }]);
 
@@ -282,3 +313,17 @@ describe('WorkflowEngine', () => {
     expect(onWorkflowComplete).toHaveBeenCalledOnce();
   });
 });
+
+describe('countStepStatuses', () => {
+  it('should count results by status in one pass', () => {
+    const startedAt = new Date();
+    const counts = countStepStatuses([
+      createStepResult('a', StepStatus.COMPLETED, null, startedAt),
+      createStepResult('b', StepStatus.FAILED, null, startedAt),
+      createStepResult('c', StepStatus.COMPLETED, null, startedAt),
+      createStepResult('d', StepStatus.SKIPPED, null, startedAt),
+    ]);
+
+    expect(counts).toEqual({ pending: 0, running: 0, completed: 2, failed: 1, skipped: 1 });
+  });
+});
@@ -39,4 +39,16 @@ describe('MCPTool', () => {
     const schema = tool.getOperationSchema('echo') as any;
     expect(schema.parameters.type).toBe('object');
   });
+
+  it('rejects operation names that are only inherited object keys', async () => {
+    const dir = mkdtempSync(join(tmpdir(), 'mcp-tool-'));
+    const specPath = join(dir, 'tools.yaml');
+    writeFileSync(specPath, `tools:\n  - name: echo\n`);
+
+    const implementation = { type: ToolType.MCP, priority: 1, specPath };
+    const tool = new MCPTool({ name: 'mcp-test', implementations: [implementation] }, implementation);
+
+    await expect(tool.execute('constructor', {})).rejects.toThrow('Unknown MCP operation: constructor');
+    expect(tool.getOperationSchema('toString')).toEqual({});
+  });
 });
@@ -136,6 +136,61 @@ describe('RedisQueue', () => {
     
     await queue.disconnect();
   });
+
+  describe('consume on a named queue', () => {
+    const msg = {
+      id: 'job-1',
+      workflowId: 'wf-1',
+      payload: {},
+      priority: MessagePriority.NORMAL,
+      status: MessageStatus.PENDING,
+      createdAt: new Date(),
+      attempts: 0,
+      maxAttempts: 3,
+      metadata: {},
+    };
+
+    async function consumeOnce(handler: () => Promise<void>) {
+      const queue = new RedisQueue('redis://localhost', { name: 'marktoflow', retryDelay: 0.001 });
+      await queue.connect();
+      const client = (queue as any).client;
+      for (const method of ['zadd', 'zpopmin', 'hset', 'hdel']) {
+        client[method].mockClear();
+      }
+      client.zpopmin.mockResolvedValueOnce([JSON.stringify(msg), '0']);
+
+      const consuming = queue.consume(handler, 'jobs');
+      await new Promise(r => setTimeout(r, 50));
+      await queue.stop();
+      await consuming;
+      return client;
+    }
+
+    it('should acknowledge on the queue it consumed from', async () => {
+      const client = await consumeOnce(async () => {});
+
+      expect(client.hset).toHaveBeenCalledWith('marktoflow:processing:jobs', 'job-1', expect.any(String));
+      expect(client.hdel).toHaveBeenCalledWith('marktoflow:processing:jobs', 'job-1');
+      expect(client.hdel).not.toHaveBeenCalledWith('marktoflow:processing:marktoflow', expect.anything());
+    });
+
+    it('should requeue a failed message onto the queue it came from', async () => {
+      const client = await consumeOnce(async () => {
+        throw new Error('boom');
+      });
+
+      expect(client.hdel).toHaveBeenCalledWith('marktoflow:processing:jobs', 'job-1');
+      expect(client.zadd).toHaveBeenCalledTimes(1);
+      const [key, , json] = client.zadd.mock.calls[0];
+      expect(key).toBe('marktoflow:queue:jobs');
+      expect(JSON.parse(json)).toMatchObject({
+        id: 'job-1',
+        attempts: 1,
+        status: MessageStatus.PENDING,
+        error: 'Error: boom',
+      });
+    });
+  });
 });
 
 describe('RabbitMQQueue', () => {
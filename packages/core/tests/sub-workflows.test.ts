@@ -5,6 +5,7 @@ import { join } from 'node:path';
 import { tmpdir } from 'node:os';
 import { SDKRegistry } from '../src/sdk-registry.js';
 import { WorkflowStatus, StepStatus } from '../src/models.js';
+import { parseSubagentResponse } from '../src/engine/subworkflow.js';
 
 describe('Sub-Workflow Tests', () => {
   let mockSDKRegistry: SDKRegistry;
@@ -447,3 +448,63 @@ steps:
     });
   });
 });
+
+describe('parseSubagentResponse', () => {
+  it('should parse a bare JSON completion object', () => {
+    const result = parseSubagentResponse('{"completed": true, "output": {"answer": 42}}');
+    expect(result).toEqual({ completed: true, output: { answer: 42 } });
+  });
+
+  it('should parse a fenced JSON block surrounded by prose', () => {
+    const result = parseSubagentResponse(
+      'All steps done.\n```json\n{"completed": true, "output": {"ok": true}}\n```\nBye.'
+    );
+    expect(result).toEqual({ completed: true, output: { ok: true } });
+  });
+
+  it('should extract content from OpenAI-style responses', () => {
+    const result = parseSubagentResponse({
+      choices: [{ message: { content: '{"completed": false, "error": "boom"}' } }],
+    });
+    expect(result).toEqual({ completed: false, error: 'boom' });
+  });
+
+  it('should find an unfenced JSON object embedded in prose', () => {
+    const result = parseSubagentResponse(
+      'Finished. Result: {"completed": true, "output": {"nested": {"a": 1}}} - see above.'
+    );
+    expect(result).toEqual({ completed: true, output: { nested: { a: 1 } } });
+  });
+
+  it('should ignore braces and escaped quotes inside embedded JSON strings', () => {
+    const result = parseSubagentResponse(
+      'Done: {"completed": true, "output": {"code": "if (x) { return \\"}\\"; }"}} trailing }'
+    );
+    expect(result).toEqual({ completed: true, output: { code: 'if (x) { return "}"; }' } });
+  });
+
+  it('should skip brace-delimited placeholders before the JSON object', () => {
+    const result = parseSubagentResponse(
+      'Replaced {name} in the template. {"completed": true, "output": {"ok": true}}'
+    );
+    expect(result).toEqual({ completed: true, output: { ok: true } });
+  });
+
+  it('should skip an unclosed brace in the prose before the JSON object', () => {
+    const result = parseSubagentResponse('Use a literal { here. {"completed": true, "output": {}}');
+    expect(result).toEqual({ completed: true, output: {} });
+  });
+
+  it('should use already-structured output without re-parsing text', () => {
+    const result = parseSubagentResponse({
+      result: 'ignored text',
+      structuredOutput: { completed: true, output: { count: 3 } },
+    });
+    expect(result).toEqual({ completed: true, output: { count: 3 } });
+  });
+
+  it('should return plain text as a continuation message', () => {
+    const result = parseSubagentResponse('Working on step 2...');
+    expect(result).toEqual({ completed: false, message: 'Working on step 2...' });
+  });
+});
@@ -1,7 +1,27 @@
 import { describe, it, expect } from 'vitest';
-import { renderTemplate } from '../src/template-engine.js';
+import { renderTemplate, hasTemplateSyntax } from '../src/template-engine.js';
+
+describe('hasTemplateSyntax', () => {
+  it('should detect expression, block and comment delimiters', () => {
+    expect(hasTemplateSyntax('Hello {{ name }}')).toBe(true);
+    expect(hasTemplateSyntax('{% if x %}y{% endif %}')).toBe(true);
+    expect(hasTemplateSyntax('{# note #}')).toBe(true);
+  });
+
+  it('should ignore plain text and single braces', () => {
+    expect(hasTemplateSyntax('Summarize the report')).toBe(false);
+    expect(hasTemplateSyntax('{"a": {"b": 1}}')).toBe(false);
+  });
+});
 
 describe('renderTemplate', () => {
+  describe('static text', () => {
+    it('should return strings without template syntax unchanged', () => {
+      const text = '  Review this PR.\n{"key": "value"}  ';
+      expect(renderTemplate(text, {})).toBe(text);
+    });
+  });
+
   describe('variable resolution', () => {
     it('should resolve simple variables', () => {
       const result = renderTemplate('{{ name }}', { name: 'Alice' });
@@ -188,6 +208,14 @@ describe('renderTemplate', () => {
     });
   });
 
+  describe('compiled template reuse', () => {
+    it('should render the same template against different contexts', () => {
+      const template = 'Hello {{ name }}, you have {{ items | length }} items';
+      expect(renderTemplate(template, { name: 'Alice', items: [1] })).toBe('Hello Alice, you have 1 items');
+      expect(renderTemplate(template, { name: 'Bob', items: [1, 2] })).toBe('Hello Bob, you have 2 items');
+    });
+  });
+
   describe('control structures', () => {
     it('should handle for loops', () => {
       const result = renderTemplate(
@@ -1,6 +1,7 @@
-import { describe, it, expect } from 'vitest';
+import { describe, it, expect, vi } from 'vitest';
 import { TriggerManager } from '../src/trigger-manager.js';
 import { TriggerType } from '../src/models.js';
+import { WebhookReceiver } from '../src/webhook.js';
 
 
 describe('TriggerManager', () => {
@@ -16,4 +17,19 @@ describe('TriggerManager', () => {
     expect(manager.list().length).toBe(1);
     expect(manager.list()[0].id).toBe('t1');
   });
+
+  it('logs a trigger that fails to stop instead of throwing', async () => {
+    const receiver = {
+      stop: vi.fn().mockRejectedValue(new Error('close failed')),
+    } as unknown as WebhookReceiver;
+    const manager = new TriggerManager(receiver);
+    const consoleError = vi.spyOn(console, 'error').mockImplementation(() => {});
+
+    await expect(manager.stop()).resolves.toBeUndefined();
+    await expect(manager.stop()).resolves.toBeUndefined();
+
+    expect(receiver.stop).toHaveBeenCalledTimes(2);
+    expect(consoleError).toHaveBeenCalledWith('[marktoflow] Failed to stop trigger:', expect.any(Error));
+    consoleError.mockRestore();
+  });
 });
@@ -94,7 +94,7 @@ export class AIService {
       };
       authType?: 'sdk' | 'api_key' | 'local' | 'demo';
       authInstructions?: string;
-      availableModels?: string[];
+      availableModels?: readonly string[];
     }>;
   }> {
     // Initialize providers if not already done
@@ -122,7 +122,7 @@ export class AIService {
         let configOptions: { apiKey?: boolean; baseUrl?: boolean; model?: boolean; port?: boolean } | undefined;
         let authType: 'sdk' | 'api_key' | 'local' | 'demo' | undefined;
         let authInstructions: string | undefined;
-        let availableModels: string[] | undefined;
+        let availableModels: readonly string[] | undefined;
 
         // Get available models from provider capabilities
         const providerInstance = this.registry.getProvider(provider.id);
@@ -44,16 +44,18 @@ interface AgentQuery extends AsyncGenerator<SDKMessage, void, unknown> {
 // The SDK exports a query function directly
 type QueryFunction = (params: { prompt: string; options?: Record<string, unknown> }) => AgentQuery;
 
+const CLAUDE_AGENT_CAPABILITIES: AgentCapabilities = Object.freeze({
+  streaming: true,
+  toolUse: true,
+  codeExecution: true,
+  systemPrompts: true,
+  models: Object.freeze(['claude-opus-4-6', 'claude-sonnet-4-5', 'claude-haiku-4-5']),
+});
+
 export class ClaudeAgentProvider implements AgentProvider {
   readonly id = 'claude-agent';
   readonly name = 'Claude Agent (SDK)';
-  readonly capabilities: AgentCapabilities = {
-    streaming: true,
-    toolUse: true,
-    codeExecution: true,
-    systemPrompts: true,
-    models: ['claude-opus-4-6', 'claude-sonnet-4-5', 'claude-haiku-4-5'],
-  };
+  readonly capabilities: AgentCapabilities = CLAUDE_AGENT_CAPABILITIES;
 
   private queryFn: QueryFunction | null = null;
   private model: string = 'claude-sonnet-4-5';
@@ -14,21 +14,23 @@ import type {
 } from './types.js';
 import { buildPrompt, generateSuggestions } from './prompts.js';
 
+const CLAUDE_CAPABILITIES: AgentCapabilities = Object.freeze({
+  streaming: true,
+  toolUse: true,
+  codeExecution: false,
+  systemPrompts: true,
+  maxContextLength: 200000,
+  models: Object.freeze([
+    'claude-opus-4-6',
+    'claude-sonnet-4-5',
+    'claude-haiku-4-5',
+  ]),
+});
+
 export class ClaudeProvider implements AgentProvider {
   readonly id = 'claude';
   readonly name = 'Claude (Anthropic)';
-  readonly capabilities: AgentCapabilities = {
-    streaming: true,
-    toolUse: true,
-    codeExecution: false,
-    systemPrompts: true,
-    maxContextLength: 200000,
-    models: [
-      'claude-opus-4-6',
-      'claude-sonnet-4-5',
-      'claude-haiku-4-5',
-    ],
-  };
+  readonly capabilities: AgentCapabilities = CLAUDE_CAPABILITIES;
 
   private client: Anthropic | null = null;
   private model: string = 'claude-sonnet-4-5';
@@ -83,21 +83,23 @@ interface CodexInstance {
   resumeThread(id: string, options?: ThreadOptions): Thread;
 }
 
+const CODEX_CAPABILITIES: AgentCapabilities = Object.freeze({
+  streaming: true,
+  toolUse: true,
+  codeExecution: true,
+  systemPrompts: true,
+  models: Object.freeze([
+    'gpt-5.2-codex',
+    'gpt-5.1-codex-max',
+    'gpt-5.2',
+    'gpt-5.1-codex-mini',
+  ]),
+});
+
 export class CodexProvider implements AgentProvider {
   readonly id = 'codex';
   readonly name = 'OpenAI Codex';
-  readonly capabilities: AgentCapabilities = {
-    streaming: true,
-    toolUse: true,
-    codeExecution: true,
-    systemPrompts: true,
-    models: [
-      'gpt-5.2-codex',
-      'gpt-5.1-codex-max',
-      'gpt-5.2',
-      'gpt-5.1-codex-mini',
-    ],
-  };
+  readonly capabilities: AgentCapabilities = CODEX_CAPABILITIES;
 
   private codex: CodexInstance | null = null;
   private model: string = 'gpt-5.2-codex';
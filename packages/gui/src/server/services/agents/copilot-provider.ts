@@ -50,30 +50,52 @@ interface SessionEvent {
   };
 }
 
+// Readiness polling after start(): ramp from a short first delay so a fast
+// local CLI is picked up quickly, without hammering a slow one. Providers are
+// detected one after another, so the budget stays close to the old fixed 1s
+// wait.
+const PING_INITIAL_DELAY_MS = 50;
+const PING_MAX_DELAY_MS = 500;
+const PING_TIMEOUT_MS = 1_500;
+
+// Frozen and shared; initialize() swaps in a copy once live models are known.
+const COPILOT_CAPABILITIES: AgentCapabilities = Object.freeze({
+  streaming: true,
+  toolUse: true,
+  codeExecution: true,
+  systemPrompts: true,
+  models: Object.freeze([
+    // Anthropic models
+    'Claude Opus 4.6',
+    'Claude Sonnet 4.5',
+    'Claude Haiku 4.5',
+    // OpenAI Codex models
+    'GPT-5.2-Codex',
+    'GPT-5.1-Codex-Max',
+    'GPT-5.2',
+    'GPT-5.1-Codex-Mini',
+    // Gemini models
+    'Gemini 3 Pro',
+    'Gemini 3 Flash',
+    'Gemini 2.5 Pro',
+  ]),
+});
+
+/**
+ * Whether a ping failure won't go away by waiting: the CLI is missing or not
+ * executable, or the user is not signed in.
+ */
+function isPermanentPingError(error: unknown): boolean {
+  const code = (error as { code?: unknown } | null)?.code;
+  if (code === 'ENOENT' || code === 'EACCES') return true;
+  const message = error instanceof Error ? error.message : String(error);
+  return /unauthori[sz]ed|forbidden|not (?:logged|signed) in|authenticat/i.test(message);
+}
+
 export class CopilotProvider implements AgentProvider {
   readonly id = 'copilot';
   readonly name = 'GitHub Copilot';
-  capabilities: AgentCapabilities = {
-    streaming: true,
-    toolUse: true,
-    codeExecution: true,
-    systemPrompts: true,
-    models: [
-      // Anthropic models
-      'Claude Opus 4.6',
-      'Claude Sonnet 4.5',
-      'Claude Haiku 4.5',
-      // OpenAI Codex models
-      'GPT-5.2-Codex',
-      'GPT-5.1-Codex-Max',
-      'GPT-5.2',
-      'GPT-5.1-Codex-Mini',
-      // Gemini models
-      'Gemini 3 Pro',
-      'Gemini 3 Flash',
-      'Gemini 2.5 Pro',
-    ],
-  };
+  capabilities: AgentCapabilities = COPILOT_CAPABILITIES;
 
   // Using 'unknown' to handle SDK version differences
   private client: unknown = null;
@@ -149,12 +171,12 @@ export class CopilotProvider implements AgentProvider {
             await client.start();
           }
 
-          // Wait a moment for connection to stabilize
-          await new Promise(resolve => setTimeout(resolve, 1000));
-
-          // Test connectivity with ping
+          // Test connectivity with ping, retrying until the connection is up
           if (typeof client.ping === 'function') {
-            await client.ping();
+            await this.waitForPing(() => client.ping!());
+          } else {
+            // Nothing to probe; give the connection a moment to stabilize
+            await new Promise(resolve => setTimeout(resolve, 1000));
           }
 
           this.ready = true;
@@ -203,6 +225,30 @@ export class CopilotProvider implements AgentProvider {
     }
   }
 
+  /**
+   * Retry ping() until it succeeds, starting at PING_INITIAL_DELAY_MS and
+   * growing 1.5x per attempt up to PING_MAX_DELAY_MS. Rethrows the ping error
+   * straight away if retrying can't help, otherwise once the next attempt
+   * would land past PING_TIMEOUT_MS.
+   */
+  private async waitForPing(ping: () => Promise<unknown>): Promise<void> {
+    const deadline = performance.now() + PING_TIMEOUT_MS;
+    let delay = PING_INITIAL_DELAY_MS;
+
+    while (true) {
+      try {
+        await ping();
+        return;
+      } catch (error) {
+        if (isPermanentPingError(error) || performance.now() + delay > deadline) {
+          throw error;
+        }
+      }
+      await new Promise(resolve => setTimeout(resolve, delay));
+      delay = Math.min(delay * 1.5, PING_MAX_DELAY_MS);
+    }
+  }
+
   isReady(): boolean {
     return this.ready;
   }
@@ -12,16 +12,18 @@ import type {
 } from './types.js';
 import { generateSuggestions, AVAILABLE_SERVICES } from './prompts.js';
 
+const DEMO_CAPABILITIES: AgentCapabilities = Object.freeze({
+  streaming: false,
+  toolUse: false,
+  codeExecution: false,
+  systemPrompts: false,
+  models: Object.freeze(['demo']),
+});
+
 export class DemoProvider implements AgentProvider {
   readonly id = 'demo';
   readonly name = 'Demo Mode (No API)';
-  readonly capabilities: AgentCapabilities = {
-    streaming: false,
-    toolUse: false,
-    codeExecution: false,
-    systemPrompts: false,
-    models: ['demo'],
-  };
+  readonly capabilities: AgentCapabilities = DEMO_CAPABILITIES;
 
   private ready: boolean = true;
 
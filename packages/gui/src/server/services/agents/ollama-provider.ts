@@ -11,6 +11,7 @@ import type {
   PromptResult,
   Workflow,
 } from './types.js';
+import { readLines } from './stream-lines.js';
 
 const SYSTEM_PROMPT = `You are an expert workflow automation assistant. Help users modify their workflows.
 
@@ -23,24 +24,26 @@ Respond with:
 1. A brief explanation of changes
 2. The complete modified workflow in YAML format between \`\`\`yaml and \`\`\``;
 
+const OLLAMA_CAPABILITIES: AgentCapabilities = Object.freeze({
+  streaming: true,
+  toolUse: false,
+  codeExecution: false,
+  systemPrompts: true,
+  models: Object.freeze([
+    'llama3.2',
+    'llama3.1',
+    'codellama',
+    'mistral',
+    'mixtral',
+    'phi3',
+    'gemma2',
+  ]),
+});
+
 export class OllamaProvider implements AgentProvider {
   readonly id = 'ollama';
   readonly name = 'Ollama (Local)';
-  readonly capabilities: AgentCapabilities = {
-    streaming: true,
-    toolUse: false,
-    codeExecution: false,
-    systemPrompts: true,
-    models: [
-      'llama3.2',
-      'llama3.1',
-      'codellama',
-      'mistral',
-      'mixtral',
-      'phi3',
-      'gemma2',
-    ],
-  };
+  readonly capabilities: AgentCapabilities = OLLAMA_CAPABILITIES;
 
   private baseUrl: string = 'http://localhost:11434';
   private model: string = 'llama3.2';
@@ -179,26 +182,15 @@ export class OllamaProvider implements AgentProvider {
         throw new Error(`Ollama API error: ${response.status}`);
       }
 
-      const reader = response.body.getReader();
-      const decoder = new TextDecoder();
-
-      while (true) {
-        const { done, value } = await reader.read();
-        if (done) break;
-
-        const chunk = decoder.decode(value);
-        const lines = chunk.split('\n').filter(Boolean);
-
-        for (const line of lines) {
-          try {
-            const data = JSON.parse(line);
-            if (data.response) {
-              fullResponse += data.response;
-              onChunk(data.response);
-            }
-          } catch {
-            // Skip invalid JSON
+      for await (const line of readLines(response.body)) {
+        try {
+          const data = JSON.parse(line);
+          if (data.response) {
+            fullResponse += data.response;
+            onChunk(data.response);
           }
+        } catch {
+          // Skip invalid JSON
         }
       }
 
@@ -3,6 +3,7 @@
  * Supports OpenAI API, VLLM, and any OpenAI-compatible endpoint
  */
 
+import { parse as yamlParse } from 'yaml';
 import type {
   AgentProvider,
   AgentCapabilities,
@@ -11,6 +12,7 @@ import type {
   Workflow,
 } from './types.js';
 import { buildPrompt, generateSuggestions } from './prompts.js';
+import { readLines } from './stream-lines.js';
 
 interface OpenAIMessage {
   role: 'system' | 'user' | 'assistant';
@@ -25,16 +27,18 @@ interface OpenAIResponse {
   }>;
 }
 
+const OPENAI_CAPABILITIES: AgentCapabilities = Object.freeze({
+  streaming: true,
+  toolUse: true,
+  codeExecution: false,
+  systemPrompts: true,
+  models: Object.freeze(['gpt-4.5', 'gpt-4.1', 'gpt-4.1-mini', 'gpt-4o', 'o3']),
+});
+
 export class OpenAIProvider implements AgentProvider {
   readonly id = 'openai';
   readonly name = 'OpenAI';
-  readonly capabilities: AgentCapabilities = {
-    streaming: true,
-    toolUse: true,
-    codeExecution: false,
-    systemPrompts: true,
-    models: ['gpt-4.5', 'gpt-4.1', 'gpt-4.1-mini', 'gpt-4o', 'o3'],
-  };
+  readonly capabilities: AgentCapabilities = OPENAI_CAPABILITIES;
 
   private apiKey: string = '';
   private baseUrl: string = 'https://api.openai.com/v1';
@@ -200,35 +204,25 @@ export class OpenAIProvider implements AgentProvider {
       }
 
       let fullResponse = '';
-      const reader = response.body?.getReader();
-      const decoder = new TextDecoder();
 
-      if (!reader) {
+      if (!response.body) {
         throw new Error('No response body');
       }
 
-      while (true) {
-        const { done, value } = await reader.read();
-        if (done) break;
-
-        const chunk = decoder.decode(value);
-        const lines = chunk.split('\n').filter((line) => line.trim() !== '');
-
-        for (const line of lines) {
-          if (line.startsWith('data: ')) {
-            const data = line.slice(6);
-            if (data === '[DONE]') continue;
-
-            try {
-              const parsed = JSON.parse(data);
-              const content = parsed.choices[0]?.delta?.content;
-              if (content) {
-                fullResponse += content;
-                onChunk(content);
-              }
-            } catch {
-              // Skip invalid JSON
+      for await (const line of readLines(response.body)) {
+        if (line.startsWith('data: ')) {
+          const data = line.slice(6);
+          if (data === '[DONE]') continue;
+
+          try {
+            const parsed = JSON.parse(data);
+            const content = parsed.choices[0]?.delta?.content;
+            if (content) {
+              fullResponse += content;
+              onChunk(content);
             }
+          } catch {
+            // Skip invalid JSON
           }
         }
       }
@@ -258,8 +252,7 @@ export class OpenAIProvider implements AgentProvider {
 
     if (yamlMatch) {
       try {
-        const { parse } = await import('yaml');
-        const parsedYaml = parse(yamlMatch[1]);
+        const parsedYaml = yamlParse(yamlMatch[1]);
         if (parsedYaml && (parsedYaml.steps || parsedYaml.metadata)) {
           modifiedWorkflow = parsedYaml as Workflow;
           const explanationMatch = responseText.match(/^([\s\S]*?)```yaml/);
@@ -8,8 +8,12 @@
  *   - Default server: http://localhost:4096
  *   - Configure via baseUrl option in GUI
  *   - Start server with: opencode serve --port 4096
+ *   - Prompt timeout via timeout (default 300s); health/session timeout via
+ *     options.connectTimeout (default 5s)
  */
 
+import { spawn } from 'node:child_process';
+import { parse as yamlParse } from 'yaml';
 import type {
   AgentProvider,
   AgentCapabilities,
@@ -19,25 +23,31 @@ import type {
 } from './types.js';
 import { buildPrompt, generateSuggestions } from './prompts.js';
 
+const OPENCODE_CAPABILITIES: AgentCapabilities = Object.freeze({
+  streaming: true,
+  toolUse: true,
+  codeExecution: true,
+  systemPrompts: true,
+  models: Object.freeze([]), // OpenCode supports many models via different backends
+});
+
 export class OpenCodeProvider implements AgentProvider {
   private static readonly DEFAULT_PORT = 4096;
   private static readonly DEFAULT_SERVER_URL = `http://localhost:${OpenCodeProvider.DEFAULT_PORT}`;
+  private static readonly DEFAULT_REQUEST_TIMEOUT_MS = 300_000;
+  private static readonly DEFAULT_CONNECT_TIMEOUT_MS = 5_000;
 
   readonly id = 'opencode';
   readonly name = 'OpenCode';
-  readonly capabilities: AgentCapabilities = {
-    streaming: true,
-    toolUse: true,
-    codeExecution: true,
-    systemPrompts: true,
-    models: [], // OpenCode supports many models via different backends
-  };
+  readonly capabilities: AgentCapabilities = OPENCODE_CAPABILITIES;
 
   private mode: 'cli' | 'server' = 'cli';
   private serverUrl: string = OpenCodeProvider.DEFAULT_SERVER_URL;
   private ready: boolean = false;
   private error: string | undefined;
   private model?: string;
+  private requestTimeout: number = OpenCodeProvider.DEFAULT_REQUEST_TIMEOUT_MS;
+  private connectTimeout: number = OpenCodeProvider.DEFAULT_CONNECT_TIMEOUT_MS;
 
   async initialize(config: AgentConfig): Promise<void> {
     try {
@@ -58,6 +68,12 @@ export class OpenCodeProvider implements AgentProvider {
         this.model = config.model;
       }
 
+      // Generation may run for minutes; health and session setup should fail fast
+      this.requestTimeout = config.timeout ?? OpenCodeProvider.DEFAULT_REQUEST_TIMEOUT_MS;
+      this.connectTimeout =
+        (config.options?.connectTimeout as number | undefined) ??
+        OpenCodeProvider.DEFAULT_CONNECT_TIMEOUT_MS;
+
       // Test availability
       if (this.mode === 'server') {
         await this.testServerConnection();
@@ -75,7 +91,9 @@ export class OpenCodeProvider implements AgentProvider {
 
   private async testServerConnection(): Promise<void> {
     try {
-      const response = await fetch(`${this.serverUrl}/health`).catch(() => null);
+      const response = await fetch(`${this.serverUrl}/health`, {
+        signal: AbortSignal.timeout(this.connectTimeout),
+      }).catch(() => null);
       if (!response || !response.ok) {
         throw new Error(
           `OpenCode server not responding at ${this.serverUrl}. Start with: opencode serve --port 4096`
@@ -90,9 +108,8 @@ export class OpenCodeProvider implements AgentProvider {
 
   private async testCLI(): Promise<void> {
     // Check if opencode CLI is available
-    const { spawn } = await import('node:child_process');
     return new Promise((resolve, reject) => {
-      const process = spawn('which', ['opencode']);
+      const process = spawn('which', ['opencode'], { stdio: 'ignore' });
       process.on('close', (code) => {
         if (code === 0) {
           resolve();
@@ -139,13 +156,19 @@ export class OpenCodeProvider implements AgentProvider {
     }
 
     try {
+      // Each prompt gets its own session: a session is a conversation, and the
+      // prompt already carries the full workflow and instructions. Creating it
+      // before building the prompt overlaps its round trip with serialization.
+      const session = this.mode === 'server' ? this.createSession() : undefined;
+      session?.catch(() => {}); // Rejection is surfaced where it is awaited
+
       const { systemPrompt, userPrompt } = buildPrompt(prompt, workflow, context);
       const fullPrompt = `${systemPrompt}\n\n---\n\nUser request: ${userPrompt}`;
 
       let responseText: string;
 
-      if (this.mode === 'server') {
-        responseText = await this.callServer(fullPrompt);
+      if (session) {
+        responseText = await this.callServer(fullPrompt, await session);
       } else {
         responseText = await this.callCLI(fullPrompt);
       }
@@ -159,12 +182,12 @@ export class OpenCodeProvider implements AgentProvider {
     }
   }
 
-  private async callServer(prompt: string): Promise<string> {
-    // Create session if needed, then send prompt
+  private async createSession(): Promise<string> {
     const sessionResponse = await fetch(`${this.serverUrl}/api/session`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify({}),
+      signal: AbortSignal.timeout(this.connectTimeout),
     });
 
     if (!sessionResponse.ok) {
@@ -172,8 +195,10 @@ export class OpenCodeProvider implements AgentProvider {
     }
 
     const sessionData = (await sessionResponse.json()) as { id: string };
-    const sessionId = sessionData.id;
+    return sessionData.id;
+  }
 
+  private async callServer(prompt: string, sessionId: string): Promise<string> {
     // Send prompt to session
     const promptResponse = await fetch(`${this.serverUrl}/api/session/${sessionId}/prompt`, {
       method: 'POST',
@@ -182,6 +207,7 @@ export class OpenCodeProvider implements AgentProvider {
         parts: [{ type: 'text', text: prompt }],
         model: this.model,
       }),
+      signal: AbortSignal.timeout(this.requestTimeout),
     });
 
     if (!promptResponse.ok) {
@@ -202,8 +228,6 @@ export class OpenCodeProvider implements AgentProvider {
   }
 
   private async callCLI(prompt: string): Promise<string> {
-    const { spawn } = await import('node:child_process');
-
     return new Promise((resolve, reject) => {
       const args = ['run'];
       if (this.model) {
@@ -211,22 +235,26 @@ export class OpenCodeProvider implements AgentProvider {
       }
       args.push(prompt);
 
-      const process = spawn('opencode', args);
-      let output = '';
-      let errorOutput = '';
+      // stdin must not be left as an open pipe: `opencode run` reads piped
+      // stdin until EOF, which would never arrive
+      const process = spawn('opencode', args, { stdio: ['ignore', 'pipe', 'pipe'] });
+      const outputChunks: Buffer[] = [];
+      const errorChunks: Buffer[] = [];
 
-      process.stdout.on('data', (data) => {
-        output += data.toString();
+      process.stdout.on('data', (data: Buffer) => {
+        outputChunks.push(data);
       });
 
-      process.stderr.on('data', (data) => {
-        errorOutput += data.toString();
+      process.stderr.on('data', (data: Buffer) => {
+        errorChunks.push(data);
       });
 
       process.on('close', (code) => {
+        const output = Buffer.concat(outputChunks).toString('utf8');
         if (code === 0) {
           resolve(output);
         } else {
+          const errorOutput = Buffer.concat(errorChunks).toString('utf8');
           reject(new Error(`OpenCode CLI failed: ${errorOutput || output}`));
         }
       });
@@ -263,8 +291,7 @@ export class OpenCodeProvider implements AgentProvider {
 
     if (yamlMatch) {
       try {
-        const { parse } = await import('yaml');
-        const parsedYaml = parse(yamlMatch[1]);
+        const parsedYaml = yamlParse(yamlMatch[1]);
         if (parsedYaml && (parsedYaml.steps || parsedYaml.metadata)) {
           modifiedWorkflow = parsedYaml as Workflow;
           const explanationMatch = responseText.match(/^([\s\S]*?)```yaml/);
@@ -9,6 +9,8 @@
  * - Adding conditions
  */
 
+import { stringify as yamlStringify } from 'yaml';
+
 // Available service integrations with their SDK mappings
 export const AVAILABLE_SERVICES = {
   slack: {
@@ -370,34 +372,52 @@ export function buildPrompt(
   const operations = detectOperations(userRequest);
 
   // Build system prompt with relevant operation guides
-  let systemPrompt = BASE_SYSTEM_PROMPT;
-  for (const op of operations) {
-    if (OPERATION_PROMPTS[op as keyof typeof OPERATION_PROMPTS]) {
-      systemPrompt += '\n' + OPERATION_PROMPTS[op as keyof typeof OPERATION_PROMPTS];
-    }
-  }
-
-  // Build user prompt with context
-  let userPrompt = `Current workflow:\n\`\`\`yaml\n${formatWorkflow(workflow)}\n\`\`\`\n\n`;
+  const systemPrompt = buildSystemPrompt(operations);
 
-  if (context?.selectedStepId) {
-    const selectedStep = workflow.steps?.find(
-      (s: any) => s.id === context.selectedStepId
-    );
-    if (selectedStep) {
-      userPrompt += `Currently selected step: "${context.selectedStepId}"\n\n`;
-    }
-  }
+  // Build user prompt with context; optional sections are empty when absent
+  const selectedStepId = context?.selectedStepId;
+  const selectedSection =
+    selectedStepId && workflow.steps?.some((s: any) => s.id === selectedStepId)
+      ? `Currently selected step: "${selectedStepId}"\n\n`
+      : '';
 
-  if (context?.recentHistory && context.recentHistory.length > 0) {
-    userPrompt += `Recent changes:\n${context.recentHistory.map((h) => `- ${h}`).join('\n')}\n\n`;
-  }
+  const history = context?.recentHistory;
+  const historySection =
+    history && history.length > 0
+      ? `Recent changes:\n${history.map((h) => `- ${h}`).join('\n')}\n\n`
+      : '';
 
-  userPrompt += `User request: ${userRequest}`;
+  const userPrompt =
+    `Current workflow:\n\`\`\`yaml\n${formatWorkflow(workflow)}\n\`\`\`\n\n` +
+    `${selectedSection}${historySection}User request: ${userRequest}`;
 
   return { systemPrompt, userPrompt };
 }
 
+// System prompts depend only on the detected operation set (at most one
+// entry per combination), so they are assembled once and reused.
+const systemPromptCache = new Map<string, string>();
+
+/**
+ * Build the system prompt for a set of detected operations
+ */
+function buildSystemPrompt(operations: string[]): string {
+  const key = operations.join(',');
+  let systemPrompt = systemPromptCache.get(key);
+  if (systemPrompt === undefined) {
+    const sections = [BASE_SYSTEM_PROMPT];
+    for (const op of operations) {
+      const guide = OPERATION_PROMPTS[op as keyof typeof OPERATION_PROMPTS];
+      if (guide) {
+        sections.push(guide);
+      }
+    }
+    systemPrompt = sections.join('\n');
+    systemPromptCache.set(key, systemPrompt);
+  }
+  return systemPrompt;
+}
+
 /**
  * Detect what type of operations the user is requesting
  */
@@ -443,8 +463,7 @@ function formatWorkflow(workflow: {
   steps: unknown[];
   tools?: Record<string, unknown>;
 }): string {
-  const { stringify } = require('yaml');
-  return stringify(workflow, { indent: 2, lineWidth: 0 });
+  return yamlStringify(workflow, { indent: 2, lineWidth: 0 });
 }
 
 /**
@@ -0,0 +1,41 @@
+/**
+ * Line reader for streaming provider responses
+ * (Ollama NDJSON, OpenAI-style server-sent events)
+ */
+
+/**
+ * Yield complete, non-empty lines from a streaming response body.
+ *
+ * Network chunks don't line up with lines, so a trailing partial line is
+ * carried into the next read, and bytes are decoded in streaming mode so a
+ * multi-byte character split across chunks stays intact.
+ */
+export async function* readLines(body: ReadableStream<Uint8Array>): AsyncGenerator<string> {
+  const reader = body.getReader();
+  const decoder = new TextDecoder();
+  let pending = '';
+
+  try {
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+
+      pending += decoder.decode(value, { stream: true });
+
+      let start = 0;
+      let newline: number;
+      while ((newline = pending.indexOf('\n', start)) !== -1) {
+        const line = pending.slice(start, newline).trim();
+        if (line) yield line;
+        start = newline + 1;
+      }
+      pending = pending.slice(start);
+    }
+
+    // Flush the decoder and any final line without a trailing newline
+    const last = (pending + decoder.decode()).trim();
+    if (last) yield last;
+  } finally {
+    reader.releaseLock();
+  }
+}
@@ -50,7 +50,7 @@ export interface AgentCapabilities {
   /** Maximum context length in tokens */
   maxContextLength?: number;
   /** List of available models */
-  models: string[];
+  models: readonly string[];
 }
 
 export interface AgentConfig {
@@ -73,6 +73,13 @@ describe('CodexProvider', () => {
       expect(provider.capabilities.models).toContain('gpt-5.1-codex-max');
       expect(provider.capabilities.models).toContain('gpt-5.2');
     });
+
+    it('should share one frozen capabilities object across instances', () => {
+      const other = new CodexProvider();
+      expect(other.capabilities).toBe(provider.capabilities);
+      expect(Object.isFrozen(provider.capabilities)).toBe(true);
+      expect(Object.isFrozen(provider.capabilities.models)).toBe(true);
+    });
   });
 
   describe('initialization', () => {
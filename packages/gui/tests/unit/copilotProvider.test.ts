@@ -0,0 +1,100 @@
+/**
+ * @vitest-environment node
+ */
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { CopilotProvider } from '../../src/server/services/agents/copilot-provider.js';
+
+const { ping } = vi.hoisted(() => ({ ping: vi.fn() }));
+
+vi.mock('@github/copilot-sdk', () => ({
+  CopilotClient: vi.fn().mockImplementation(() => ({
+    start: vi.fn().mockResolvedValue(undefined),
+    ping,
+    listModels: vi.fn().mockResolvedValue([]),
+  })),
+}));
+
+describe('CopilotProvider readiness', () => {
+  let pingTimes: number[];
+
+  beforeEach(() => {
+    vi.useFakeTimers({ toFake: ['setTimeout', 'clearTimeout', 'Date', 'performance'] });
+    pingTimes = [];
+    ping.mockReset();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  const gaps = () => pingTimes.slice(1).map((t, i) => t - pingTimes[i]);
+
+  it('should retry ping with a ramped delay until the CLI answers', async () => {
+    let failures = 3;
+    ping.mockImplementation(async () => {
+      pingTimes.push(Date.now());
+      if (failures-- > 0) throw new Error('not connected');
+    });
+
+    const provider = new CopilotProvider();
+    const init = provider.initialize({});
+    await vi.advanceTimersByTimeAsync(1_000);
+    await init;
+
+    expect(provider.isReady()).toBe(true);
+    expect(ping).toHaveBeenCalledTimes(4);
+    const [first, second, third] = gaps();
+    expect(first).toBe(50);
+    expect(second).toBe(75);
+    expect(third).toBeGreaterThanOrEqual(112);
+    expect(third).toBeLessThanOrEqual(113);
+  });
+
+  it('should give up after 1.5s and report the last ping error', async () => {
+    ping.mockImplementation(async () => {
+      pingTimes.push(Date.now());
+      throw new Error('connection refused');
+    });
+
+    const provider = new CopilotProvider();
+    const init = provider.initialize({});
+    await vi.advanceTimersByTimeAsync(5_000);
+    await init;
+
+    expect(provider.isReady()).toBe(false);
+    expect(provider.getStatus().error).toBe(
+      'Cannot connect to GitHub Copilot CLI: connection refused'
+    );
+    expect(pingTimes[pingTimes.length - 1] - pingTimes[0]).toBeLessThanOrEqual(1_500);
+    expect(Math.max(...gaps())).toBeLessThanOrEqual(500);
+  });
+
+  it('should not retry when the CLI is missing', async () => {
+    ping.mockImplementation(async () => {
+      pingTimes.push(Date.now());
+      throw Object.assign(new Error('spawn copilot ENOENT'), { code: 'ENOENT' });
+    });
+
+    const provider = new CopilotProvider();
+    const init = provider.initialize({});
+    await vi.advanceTimersByTimeAsync(5_000);
+    await init;
+
+    expect(ping).toHaveBeenCalledTimes(1);
+    expect(provider.getStatus().error).toBe(
+      'Cannot connect to GitHub Copilot CLI: spawn copilot ENOENT'
+    );
+  });
+
+  it('should not retry when the user is not signed in', async () => {
+    ping.mockRejectedValue(new Error('Not authenticated: run copilot auth login'));
+
+    const provider = new CopilotProvider();
+    const init = provider.initialize({});
+    await vi.advanceTimersByTimeAsync(5_000);
+    await init;
+
+    expect(ping).toHaveBeenCalledTimes(1);
+    expect(provider.isReady()).toBe(false);
+  });
+});
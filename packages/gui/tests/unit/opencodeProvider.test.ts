@@ -0,0 +1,166 @@
+/**
+ * @vitest-environment node
+ */
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { EventEmitter } from 'node:events';
+import { spawn } from 'node:child_process';
+import { OpenCodeProvider } from '../../src/server/services/agents/opencode-provider.js';
+import { buildPrompt } from '../../src/server/services/agents/prompts.js';
+import type { Workflow } from '../../src/server/services/agents/types.js';
+
+vi.mock('node:child_process', () => ({ spawn: vi.fn() }));
+vi.mock('../../src/server/services/agents/prompts.js', async (importOriginal) => {
+  const actual = await importOriginal<typeof import('../../src/server/services/agents/prompts.js')>();
+  return { ...actual, buildPrompt: vi.fn(actual.buildPrompt) };
+});
+
+const workflowA: Workflow = { metadata: { id: 'workflow-a', name: 'A' }, steps: [] };
+
+function jsonResponse(body: unknown, status = 200): Response {
+  return new Response(JSON.stringify(body), { status });
+}
+
+describe('OpenCodeProvider (server mode)', () => {
+  let fetchMock: ReturnType<typeof vi.fn>;
+  let sessionCount: number;
+
+  const sessionCreates = () =>
+    fetchMock.mock.calls.filter(([url]) => String(url).endsWith('/api/session'));
+  const promptSessions = () =>
+    fetchMock.mock.calls
+      .map(([url]) => String(url).match(/\/api\/session\/([^/]+)\/prompt$/)?.[1])
+      .filter(Boolean);
+
+  async function createProvider(): Promise<OpenCodeProvider> {
+    const provider = new OpenCodeProvider();
+    await provider.initialize({ baseUrl: 'http://opencode.test' });
+    expect(provider.isReady()).toBe(true);
+    return provider;
+  }
+
+  beforeEach(() => {
+    sessionCount = 0;
+    fetchMock = vi.fn(async (url: string, _init?: RequestInit) => {
+      if (url.endsWith('/health')) return jsonResponse({ ok: true });
+      if (url.endsWith('/api/session')) return jsonResponse({ id: `sess-${++sessionCount}` });
+      return jsonResponse({ parts: [{ type: 'text', text: 'Done' }] });
+    });
+    vi.stubGlobal('fetch', fetchMock);
+    vi.mocked(buildPrompt).mockClear();
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  it('should open a new session for every prompt', async () => {
+    const provider = await createProvider();
+
+    await provider.processPrompt('Add a step', workflowA);
+    await provider.processPrompt('Rename it', workflowA);
+
+    expect(sessionCreates()).toHaveLength(2);
+    expect(promptSessions()).toEqual(['sess-1', 'sess-2']);
+  });
+
+  it('should give concurrent prompts their own sessions, created while the prompt is built', async () => {
+    const provider = await createProvider();
+
+    await Promise.all([
+      provider.processPrompt('Add a step', workflowA),
+      provider.processPrompt('Add another', workflowA),
+    ]);
+
+    expect(sessionCreates()).toHaveLength(2);
+    expect([...promptSessions()].sort()).toEqual(['sess-1', 'sess-2']);
+
+    // Each session request is already in flight when its prompt is built
+    const createOrder = fetchMock.mock.invocationCallOrder.filter((_, i) =>
+      String(fetchMock.mock.calls[i][0]).endsWith('/api/session')
+    );
+    const buildOrder = vi.mocked(buildPrompt).mock.invocationCallOrder;
+    expect(buildOrder).toHaveLength(2);
+    buildOrder.forEach((order, i) => expect(createOrder[i]).toBeLessThan(order));
+  });
+
+  it('should report a failed session creation', async () => {
+    const provider = await createProvider();
+
+    fetchMock.mockImplementationOnce(async () => jsonResponse({}, 500));
+    const failed = await provider.processPrompt('Add a step', workflowA);
+
+    expect(failed.error).toBe('Failed to create OpenCode session');
+    expect(promptSessions()).toEqual([]);
+  });
+
+  it('should bound health and session requests with the connect timeout', async () => {
+    const timeoutSpy = vi.spyOn(AbortSignal, 'timeout');
+    const provider = new OpenCodeProvider();
+    await provider.initialize({
+      baseUrl: 'http://opencode.test',
+      timeout: 60_000,
+      options: { connectTimeout: 1_000 },
+    });
+
+    await provider.processPrompt('Add a step', workflowA);
+
+    // health, session create, prompt
+    expect(timeoutSpy.mock.calls.map(([ms]) => ms)).toEqual([1_000, 1_000, 60_000]);
+    for (const [, init] of fetchMock.mock.calls) {
+      expect(init?.signal).toBeInstanceOf(AbortSignal);
+    }
+    timeoutSpy.mockRestore();
+  });
+
+  it('should default to a 5s connect and 300s prompt timeout', async () => {
+    const timeoutSpy = vi.spyOn(AbortSignal, 'timeout');
+    const provider = await createProvider();
+
+    await provider.processPrompt('Add a step', workflowA);
+
+    expect(timeoutSpy.mock.calls.map(([ms]) => ms)).toEqual([5_000, 5_000, 300_000]);
+    timeoutSpy.mockRestore();
+  });
+});
+
+describe('OpenCodeProvider (CLI mode)', () => {
+  // A child process that prints `stdout` and exits cleanly
+  function fakeProcess(stdout: string) {
+    const proc = Object.assign(new EventEmitter(), {
+      stdout: new EventEmitter(),
+      stderr: new EventEmitter(),
+    });
+    setImmediate(() => {
+      proc.stdout.emit('data', Buffer.from(stdout));
+      proc.emit('close', 0);
+    });
+    return proc;
+  }
+
+  beforeEach(() => {
+    vi.mocked(spawn).mockReset();
+    vi.mocked(spawn).mockImplementation((() => fakeProcess('Done')) as unknown as typeof spawn);
+  });
+
+  it('should not leave pipes open on the availability check', async () => {
+    const provider = new OpenCodeProvider();
+    await provider.initialize({});
+
+    expect(provider.isReady()).toBe(true);
+    expect(spawn).toHaveBeenCalledWith('which', ['opencode'], { stdio: 'ignore' });
+  });
+
+  it('should run prompts with stdin closed and output piped', async () => {
+    const provider = new OpenCodeProvider();
+    await provider.initialize({ model: 'anthropic/claude-sonnet' });
+
+    const result = await provider.processPrompt('Add a step', workflowA);
+
+    expect(result.explanation).toBe('Done');
+    expect(spawn).toHaveBeenLastCalledWith(
+      'opencode',
+      ['run', '--model', 'anthropic/claude-sonnet', expect.stringContaining('Add a step')],
+      { stdio: ['ignore', 'pipe', 'pipe'] }
+    );
+  });
+});
@@ -0,0 +1,34 @@
+/**
+ * @vitest-environment node
+ */
+import { describe, it, expect } from 'vitest';
+import { buildPrompt } from '../../src/server/services/agents/prompts.js';
+
+const workflow = {
+  metadata: { id: 'demo', name: 'Demo' },
+  steps: [{ id: 'fetch', action: 'http.get' }],
+};
+
+describe('buildPrompt', () => {
+  it('should place selected step and history before the request', () => {
+    const { userPrompt } = buildPrompt('Add a retry', workflow, {
+      selectedStepId: 'fetch',
+      recentHistory: ['Renamed step', 'Added input'],
+    });
+
+    expect(userPrompt).toMatch(/^Current workflow:\n```yaml\n[\s\S]*\n```\n\n/);
+    expect(userPrompt).toContain(
+      'Currently selected step: "fetch"\n\n' +
+        'Recent changes:\n- Renamed step\n- Added input\n\n' +
+        'User request: Add a retry'
+    );
+  });
+
+  it('should omit sections without context', () => {
+    const { userPrompt } = buildPrompt('Add a retry', workflow, { selectedStepId: 'missing' });
+
+    expect(userPrompt).not.toContain('Currently selected step');
+    expect(userPrompt).not.toContain('Recent changes');
+    expect(userPrompt).toMatch(/```\n\nUser request: Add a retry$/);
+  });
+});
@@ -0,0 +1,47 @@
+/**
+ * @vitest-environment node
+ */
+import { describe, it, expect } from 'vitest';
+import { readLines } from '../../src/server/services/agents/stream-lines.js';
+
+function streamOf(chunks: Uint8Array[]): ReadableStream<Uint8Array> {
+  return new ReadableStream({
+    start(controller) {
+      for (const chunk of chunks) controller.enqueue(chunk);
+      controller.close();
+    },
+  });
+}
+
+async function collect(chunks: Uint8Array[]): Promise<string[]> {
+  const lines: string[] = [];
+  for await (const line of readLines(streamOf(chunks))) {
+    lines.push(line);
+  }
+  return lines;
+}
+
+const encode = (text: string) => new TextEncoder().encode(text);
+
+describe('readLines', () => {
+  it('should reassemble a line split across chunks', async () => {
+    const lines = await collect([encode('{"response":"Hel'), encode('lo"}\n{"response":"!"}\n')]);
+    expect(lines).toEqual(['{"response":"Hello"}', '{"response":"!"}']);
+  });
+
+  it('should keep multi-byte characters split across chunks intact', async () => {
+    const bytes = encode('data: {"content":"héllo"}\n');
+    const lines = await collect([bytes.subarray(0, 20), bytes.subarray(20)]);
+    expect(lines).toEqual(['data: {"content":"héllo"}']);
+  });
+
+  it('should skip blank lines and strip carriage returns', async () => {
+    const lines = await collect([encode('data: a\r\n\r\ndata: b\r\n')]);
+    expect(lines).toEqual(['data: a', 'data: b']);
+  });
+
+  it('should emit a final line without a trailing newline', async () => {
+    const lines = await collect([encode('one\ntwo')]);
+    expect(lines).toEqual(['one', 'two']);
+  });
+});
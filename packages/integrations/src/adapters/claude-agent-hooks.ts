@@ -9,6 +9,7 @@
  * - Security enforcement
  */
 
+import { appendFile } from 'node:fs/promises';
 import {
   HookCallback,
   HookInput,
@@ -96,7 +97,6 @@ export class FileAuditLogger implements AuditLogger {
   async flush(): Promise<void> {
     if (this.buffer.length === 0) return;
 
-    const { appendFile } = await import('node:fs/promises');
     const lines = this.buffer.map((e) => JSON.stringify(e)).join('\n') + '\n';
 
     await appendFile(this.filePath, lines);
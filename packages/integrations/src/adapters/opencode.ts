@@ -2,15 +2,65 @@ import { spawn } from 'node:child_process';
 import { ToolConfig, SDKInitializer } from '@marktoflow/core';
 import { createOpencodeClient, OpencodeClient } from '@opencode-ai/sdk';
 
+// Only the end of stderr is reported when the CLI fails
+const STDERR_TAIL_BYTES = 64 * 1024;
+
+// How long auto mode sticks to the CLI after the server can't be reached
+const SERVER_RETRY_INTERVAL_MS = 30_000;
+
+// Socket errors meaning nothing is listening at the server URL
+const CONNECTION_ERROR_CODES = new Set([
+  'ECONNREFUSED',
+  'ENOTFOUND',
+  'EHOSTUNREACH',
+  'ENETUNREACH',
+  'EAI_AGAIN',
+]);
+
+// Default cap on prompts in flight to the server at once
+const DEFAULT_MAX_CONCURRENCY = 16;
+
+/**
+ * Whether a server call failed because no connection could be made (as
+ * opposed to an error reported by a running server). fetch() rejects with a
+ * TypeError whose cause carries the socket error code.
+ */
+function isConnectionFailure(error: unknown): boolean {
+  const cause = (error as { cause?: { code?: unknown } } | null)?.cause;
+  const code = cause?.code ?? (error as { code?: unknown } | null)?.code;
+  if (typeof code === 'string' && CONNECTION_ERROR_CODES.has(code)) return true;
+  return error instanceof TypeError && error.message === 'fetch failed';
+}
+
+/**
+ * Whether the CLI could not be started at all (not installed or not executable).
+ */
+function isSpawnFailure(error: unknown): boolean {
+  const code = (error as { code?: unknown } | null)?.code;
+  return code === 'ENOENT' || code === 'EACCES';
+}
+
+/**
+ * Client for OpenCode via its server (SDK) or the `opencode run` CLI.
+ *
+ * In server mode all prompts go to one session, which is a single
+ * conversation. `maxConcurrency` caps how many are sent at once.
+ */
 export class OpenCodeClient {
   private mode: 'cli' | 'server' | 'auto';
   private serverUrl: string;
   private cliPath: string;
   private model: string | undefined;
+  private cliArgsPrefix: string[];
   // @ts-ignore - Stored for future SDK support
   private excludeFiles: string[] | undefined;
   private sdkClient: OpencodeClient | null = null;
   private currentSessionId: string | null = null;
+  private pendingSession: Promise<string> | null = null;
+  private serverRetryAt = 0;
+  private maxConcurrency: number;
+  private promptsInFlight = 0;
+  private promptWaiters: Array<() => void> = [];
 
   constructor(options: {
     mode?: 'cli' | 'server' | 'auto';
@@ -19,6 +69,7 @@ export class OpenCodeClient {
     model?: string;
     excludeFiles?: string[];
     sessionId?: string;
+    maxConcurrency?: number;
   } = {}) {
     this.mode = options.mode || 'auto';
     this.serverUrl = options.serverUrl || 'http://localhost:4096';
@@ -26,6 +77,13 @@ export class OpenCodeClient {
     this.model = options.model;
     this.excludeFiles = options.excludeFiles;
     this.currentSessionId = options.sessionId || null;
+    this.maxConcurrency = options.maxConcurrency ?? DEFAULT_MAX_CONCURRENCY;
+    // A NaN cap (e.g. from a non-numeric option) would block every prompt
+    if (!Number.isInteger(this.maxConcurrency) || this.maxConcurrency < 1) {
+      throw new Error(`Invalid maxConcurrency: ${options.maxConcurrency} (expected a positive integer)`);
+    }
+    // Model is fixed for the client's lifetime, so build the static argv once
+    this.cliArgsPrefix = this.model ? ['run', '--model', this.model] : ['run'];
 
     if (this.mode === 'server' || this.mode === 'auto') {
       this.sdkClient = createOpencodeClient({
@@ -42,11 +100,31 @@ export class OpenCodeClient {
     } else if (this.mode === 'cli') {
       return this.generateViaCli(prompt);
     } else {
-      // Auto mode: try server, fall back to CLI
+      // Auto mode: try server, fall back to CLI. A server that can't be
+      // reached is not re-probed on every call, only once the retry interval
+      // has passed; other server errors are retried on the next call.
+      let serverError: unknown;
+      if (performance.now() >= this.serverRetryAt) {
+        try {
+          return await this.generateViaServer(prompt);
+        } catch (err) {
+          if (isConnectionFailure(err)) {
+            this.serverRetryAt = performance.now() + SERVER_RETRY_INTERVAL_MS;
+          }
+          serverError = err;
+        }
+      }
+
       try {
-        return await this.generateViaServer(prompt);
-      } catch (e) {
-        return this.generateViaCli(prompt);
+        return await this.generateViaCli(prompt);
+      } catch (err) {
+        if (!isSpawnFailure(err)) throw err;
+        // Without a CLI the server is the only option: report its error, or
+        // try it despite the backoff
+        if (serverError !== undefined) throw serverError;
+        const result = await this.generateViaServer(prompt);
+        this.serverRetryAt = 0;
+        return result;
       }
     }
   }
@@ -60,6 +138,20 @@ export class OpenCodeClient {
       return this.currentSessionId;
     }
 
+    // Coalesce concurrent callers onto a single session.create request
+    if (!this.pendingSession) {
+      this.pendingSession = this.createSession().finally(() => {
+        this.pendingSession = null;
+      });
+    }
+    return this.pendingSession;
+  }
+
+  private async createSession(): Promise<string> {
+    if (!this.sdkClient) {
+      throw new Error('OpenCode SDK client not initialized');
+    }
+
     const sessionRes = await this.sdkClient.session.create();
     if (sessionRes.error) {
       throw new Error(`Failed to create OpenCode session: ${JSON.stringify(sessionRes.error)}`);
@@ -74,19 +166,22 @@ export class OpenCodeClient {
   }
 
   private async generateViaServer(prompt: string): Promise<string> {
-    if (!this.sdkClient) {
+    const sdkClient = this.sdkClient;
+    if (!sdkClient) {
       throw new Error('OpenCode SDK client not initialized');
     }
 
     const sessionId = await this.getOrCreateSession();
 
     // Use session.prompt() with SDK v1.1.53 API
-    const response = await this.sdkClient.session.prompt({
-      path: { id: sessionId },
-      body: {
-        parts: [{ type: 'text' as const, text: prompt }],
-      },
-    });
+    const response = await this.withPromptSlot(() =>
+      sdkClient.session.prompt({
+        path: { id: sessionId },
+        body: {
+          parts: [{ type: 'text' as const, text: prompt }],
+        },
+      })
+    );
 
     if (response.error) {
       throw new Error(`Failed to generate response: ${JSON.stringify(response.error)}`);
@@ -107,36 +202,72 @@ export class OpenCodeClient {
     return JSON.stringify(data);
   }
 
-  private async generateViaCli(prompt: string): Promise<string> {
-    const args = ['run'];
-    if (this.model) {
-      args.push('--model', this.model);
+  /**
+   * Run `fn` once fewer than `maxConcurrency` prompts are in flight.
+   */
+  private async withPromptSlot<T>(fn: () => Promise<T>): Promise<T> {
+    if (this.promptsInFlight < this.maxConcurrency) {
+      this.promptsInFlight++;
+    } else {
+      await new Promise<void>((resolve) => this.promptWaiters.push(resolve));
+    }
+
+    try {
+      return await fn();
+    } finally {
+      // Hand the slot straight to the next waiter, if any
+      const next = this.promptWaiters.shift();
+      if (next) {
+        next();
+      } else {
+        this.promptsInFlight--;
+      }
     }
-    args.push(prompt);
+  }
+
+  /**
+   * Run a single prompt through `opencode run`.
+   *
+   * Every call pays CLI process startup: `opencode run` has no long-lived
+   * stdin mode to keep warm. Workflows issuing many prompts should run
+   * `opencode serve` and use server (or auto) mode, which reuses one
+   * server process and session.
+   */
+  private async generateViaCli(prompt: string): Promise<string> {
+    const args = [...this.cliArgsPrefix, prompt];
 
     return new Promise((resolve, reject) => {
       const process = spawn(this.cliPath, args, {
         stdio: ['ignore', 'pipe', 'pipe']
       });
-      let stdout = '';
-      let stderr = '';
-
-      process.stdout.on('data', d => {
-        stdout += d.toString();
+      // Collect raw chunks and decode once on close; per-chunk toString()
+      // re-copies the output and can split multi-byte UTF-8 sequences.
+      const stdoutChunks: Buffer[] = [];
+      const stderrChunks: Buffer[] = [];
+      let stderrBytes = 0;
+
+      process.stdout.on('data', (d: Buffer) => {
+        stdoutChunks.push(d);
       });
-      process.stderr.on('data', d => {
-        stderr += d.toString();
+      process.stderr.on('data', (d: Buffer) => {
+        // Keep a bounded tail so a chatty CLI can't grow this without limit
+        stderrChunks.push(d);
+        stderrBytes += d.length;
+        while (stderrBytes - stderrChunks[0].length >= STDERR_TAIL_BYTES) {
+          stderrBytes -= stderrChunks.shift()!.length;
+        }
       });
 
       process.on('close', code => {
         if (code === 0) {
-           let output = stdout.trim();
+           let output = Buffer.concat(stdoutChunks).toString('utf8').trim();
            // Strip <output> tags if present
            if (output.startsWith('<output>') && output.endsWith('</output>')) {
              output = output.slice(8, -9).trim();
            }
            resolve(output);
         } else {
+           const stderr = Buffer.concat(stderrChunks).subarray(-STDERR_TAIL_BYTES).toString('utf8');
            reject(new Error(`OpenCode CLI failed (exit code ${code})\nSTDERR: ${stderr}`));
         }
       });
@@ -344,6 +475,7 @@ export const OpenCodeInitializer: SDKInitializer = {
       model: options['model'] as string,
       excludeFiles: options['excludeFiles'] as string[],
       sessionId: options['sessionId'] as string,
+      maxConcurrency: options['maxConcurrency'] as number | undefined,
     });
   },
 };
@@ -8,6 +8,7 @@
  * browser control without additional API costs.
  */
 
+import { parseJsonFromText } from '@marktoflow/core';
 import type { PlaywrightClient } from './playwright.js';
 import type { GitHubCopilotClient } from '../adapters/github-copilot.js';
 import type { OpenAIClient } from '../adapters/openai.js';
@@ -334,7 +335,7 @@ Current Page URL: ${url}
 
 Extraction Task: ${instruction}
 
-${schema ? `Expected JSON Schema:\n${JSON.stringify(schema, null, 2)}\n` : ''}
+${schema ? `Expected JSON Schema:\n${JSON.stringify(schema)}\n` : ''}
 HTML Content:
 ${truncatedHtml}
 
@@ -357,14 +358,14 @@ JSON:`;
   private parseActionResponse(response: string): { action: string; inputs: Record<string, unknown> } | null {
     try {
       // Extract JSON from response (handle markdown code blocks)
-      const jsonMatch = response.match(/\{[\s\S]*\}/);
-      if (!jsonMatch) {
+      const parsed = parseJsonFromText(response) as
+        | { action: string; inputs: Record<string, unknown> }
+        | undefined;
+      if (!parsed) {
         console.error('[AI Browser] No JSON found in response:', response);
         return null;
       }
 
-      const parsed = JSON.parse(jsonMatch[0]);
-
       if (!parsed.action || !parsed.inputs) {
         console.error('[AI Browser] Invalid action format:', parsed);
         return null;
@@ -380,14 +381,12 @@ JSON:`;
   private parseObserveResponse(response: string): ObservedElement[] {
     try {
       // Extract JSON array from response
-      const jsonMatch = response.match(/\[[\s\S]*\]/);
-      if (!jsonMatch) {
+      const parsed = parseJsonFromText(response, '[');
+      if (parsed === undefined) {
         console.error('[AI Browser] No JSON array found in response');
         return [];
       }
 
-      const parsed = JSON.parse(jsonMatch[0]);
-
       if (!Array.isArray(parsed)) {
         console.error('[AI Browser] Response is not an array');
         return [];
@@ -403,12 +402,12 @@ JSON:`;
   private parseExtractResponse(response: string): unknown {
     try {
       // Extract JSON from response
-      const jsonMatch = response.match(/\{[\s\S]*\}|\[[\s\S]*\]/);
-      if (!jsonMatch) {
+      const parsed = parseJsonFromText(response, '{[');
+      if (parsed === undefined) {
         throw new Error('No JSON found in AI response');
       }
 
-      return JSON.parse(jsonMatch[0]);
+      return parsed;
     } catch (error) {
       throw new Error(`Failed to parse extraction response: ${error instanceof Error ? error.message : String(error)}`);
     }
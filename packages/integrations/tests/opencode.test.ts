@@ -61,6 +61,30 @@ vi.mock('@opencode-ai/sdk', () => ({
 
 import { spawn } from 'node:child_process';
 
+// What fetch() rejects with when nothing is listening at the server URL
+function connectionRefused(): TypeError {
+  return Object.assign(new TypeError('fetch failed'), { cause: { code: 'ECONNREFUSED' } });
+}
+
+// A CLI process that either prints `stdout` and exits cleanly or fails to spawn
+function cliProcess(result: { stdout?: string; spawnError?: string }) {
+  const mockProcess = new EventEmitter() as any;
+  mockProcess.stdout = new EventEmitter();
+  mockProcess.stderr = new EventEmitter();
+  setImmediate(() => {
+    if (result.spawnError) {
+      const err = Object.assign(new Error(`spawn opencode ${result.spawnError}`), {
+        code: result.spawnError,
+      });
+      mockProcess.emit('error', err);
+      return;
+    }
+    mockProcess.stdout.emit('data', Buffer.from(result.stdout ?? ''));
+    mockProcess.emit('close', 0);
+  });
+  return mockProcess;
+}
+
 describe('OpenCode Integration', () => {
   afterEach(() => {
     vi.clearAllMocks();
@@ -99,7 +123,7 @@ describe('OpenCode Integration', () => {
     const promise = client.generate('Hello');
 
     // Simulate process execution
-    mockProcess.stdout.emit('data', '<output>Response from OpenCode</output>');
+    mockProcess.stdout.emit('data', Buffer.from('<output>Response from OpenCode</output>'));
     mockProcess.emit('close', 0);
 
     const result = await promise;
@@ -107,6 +131,63 @@ describe('OpenCode Integration', () => {
     expect(spawn).toHaveBeenCalledWith('opencode', ['run', 'Hello'], expect.objectContaining({ stdio: ['ignore', 'pipe', 'pipe'] }));
   });
 
+  it('should decode multi-byte characters split across stdout chunks', async () => {
+    const client = new OpenCodeClient({ mode: 'cli' });
+
+    const mockProcess = new EventEmitter() as any;
+    mockProcess.stdout = new EventEmitter();
+    mockProcess.stderr = new EventEmitter();
+    (spawn as any).mockReturnValue(mockProcess);
+
+    const promise = client.generate('Hello');
+
+    const bytes = Buffer.from('caf\u00e9 \u2713');
+    mockProcess.stdout.emit('data', bytes.subarray(0, 4));
+    mockProcess.stdout.emit('data', bytes.subarray(4));
+    mockProcess.emit('close', 0);
+
+    await expect(promise).resolves.toBe('caf\u00e9 \u2713');
+  });
+
+  it('should report only the tail of stderr on failure', async () => {
+    const client = new OpenCodeClient({ mode: 'cli' });
+
+    const mockProcess = new EventEmitter() as any;
+    mockProcess.stdout = new EventEmitter();
+    mockProcess.stderr = new EventEmitter();
+    (spawn as any).mockReturnValue(mockProcess);
+
+    const promise = client.generate('Hello');
+    mockProcess.stderr.emit('data', Buffer.alloc(128 * 1024, 'x'));
+    mockProcess.stderr.emit('data', Buffer.from('fatal: auth failed'));
+    mockProcess.emit('close', 1);
+
+    const error = await promise.catch((e: Error) => e);
+    expect(error).toBeInstanceOf(Error);
+    expect((error as Error).message).toContain('exit code 1');
+    expect((error as Error).message).toContain('fatal: auth failed');
+    expect((error as Error).message.length).toBeLessThan(65 * 1024);
+  });
+
+  it('should pass the configured model to the cli', async () => {
+    const client = new OpenCodeClient({ mode: 'cli', model: 'anthropic/claude-sonnet' });
+
+    const mockProcess = new EventEmitter() as any;
+    mockProcess.stdout = new EventEmitter();
+    mockProcess.stderr = new EventEmitter();
+    (spawn as any).mockReturnValue(mockProcess);
+
+    const promise = client.generate('Hello');
+    mockProcess.emit('close', 0);
+    await promise;
+
+    expect(spawn).toHaveBeenCalledWith(
+      'opencode',
+      ['run', '--model', 'anthropic/claude-sonnet', 'Hello'],
+      expect.anything()
+    );
+  });
+
   it('should initialize with excludeFiles option', async () => {
     const config = {
       sdk: 'opencode',
@@ -159,13 +240,126 @@ describe('OpenCode Integration', () => {
       const promise = client.generate('Hello');
       // Small delay to let async auto-mode try server and fall back
       await new Promise(r => setTimeout(r, 10));
-      mockProcess.stdout.emit('data', 'CLI response');
+      mockProcess.stdout.emit('data', Buffer.from('CLI response'));
       mockProcess.emit('close', 0);
 
       const result = await promise;
       expect(result).toBe('CLI response');
     });
 
+    it('should not re-probe a failed server on every auto-mode call', async () => {
+      const config = {
+        sdk: 'opencode',
+        options: { mode: 'auto', cliPath: 'opencode' }
+      };
+
+      const client = await OpenCodeInitializer.initialize({}, config) as OpenCodeClient;
+
+      const { createOpencodeClient } = await import('@opencode-ai/sdk');
+      const mockSdkClient = (createOpencodeClient as any)();
+      mockSdkClient.session.create.mockRejectedValueOnce(connectionRefused());
+
+      const runCli = async (text: string) => {
+        const mockProcess = new EventEmitter() as any;
+        mockProcess.stdout = new EventEmitter();
+        mockProcess.stderr = new EventEmitter();
+        (spawn as any).mockReturnValue(mockProcess);
+        const promise = client.generate('Hello');
+        await new Promise(r => setTimeout(r, 10));
+        mockProcess.stdout.emit('data', Buffer.from(text));
+        mockProcess.emit('close', 0);
+        return promise;
+      };
+
+      expect(await runCli('first')).toBe('first');
+      expect(await runCli('second')).toBe('second');
+      expect(mockSdkClient.session.create).toHaveBeenCalledTimes(1);
+      expect(mockSdkClient.session.prompt).not.toHaveBeenCalled();
+    });
+
+    it('should re-probe an unreachable server once the retry interval has passed', async () => {
+      const config = {
+        sdk: 'opencode',
+        options: { mode: 'auto', cliPath: 'opencode' }
+      };
+
+      const client = await OpenCodeInitializer.initialize({}, config) as OpenCodeClient;
+
+      const { createOpencodeClient } = await import('@opencode-ai/sdk');
+      const mockSdkClient = (createOpencodeClient as any)();
+      mockSdkClient.session.create.mockRejectedValueOnce(connectionRefused());
+      (spawn as any).mockImplementationOnce(() => cliProcess({ stdout: 'CLI response' }));
+
+      const now = vi.spyOn(performance, 'now').mockReturnValue(1_000);
+      try {
+        expect(await client.generate('Hello')).toBe('CLI response');
+        now.mockReturnValue(1_000 + 30_000);
+        expect(await client.generate('Hello')).toBe('Server response');
+      } finally {
+        now.mockRestore();
+      }
+      expect(mockSdkClient.session.create).toHaveBeenCalledTimes(2);
+    });
+
+    it('should keep using the server after an error it reports', async () => {
+      const config = {
+        sdk: 'opencode',
+        options: { mode: 'auto', cliPath: 'opencode' }
+      };
+
+      const client = await OpenCodeInitializer.initialize({}, config) as OpenCodeClient;
+
+      const { createOpencodeClient } = await import('@opencode-ai/sdk');
+      const mockSdkClient = (createOpencodeClient as any)();
+      mockSdkClient.session.prompt.mockResolvedValueOnce({
+        data: null,
+        error: { message: 'Internal server error' },
+      });
+      (spawn as any).mockImplementationOnce(() => cliProcess({ stdout: 'CLI response' }));
+
+      expect(await client.generate('Hello')).toBe('CLI response');
+      expect(await client.generate('Hello')).toBe('Server response');
+      expect(mockSdkClient.session.prompt).toHaveBeenCalledTimes(2);
+    });
+
+    it('should report the server error when the CLI is not installed', async () => {
+      const config = {
+        sdk: 'opencode',
+        options: { mode: 'auto', cliPath: 'opencode' }
+      };
+
+      const client = await OpenCodeInitializer.initialize({}, config) as OpenCodeClient;
+
+      const { createOpencodeClient } = await import('@opencode-ai/sdk');
+      const mockSdkClient = (createOpencodeClient as any)();
+      mockSdkClient.session.prompt.mockResolvedValueOnce({
+        data: null,
+        error: { message: 'Internal server error' },
+      });
+      (spawn as any).mockImplementationOnce(() => cliProcess({ spawnError: 'ENOENT' }));
+
+      await expect(client.generate('Hello')).rejects.toThrow('Internal server error');
+    });
+
+    it('should try an unreachable server again when the CLI is not installed', async () => {
+      const config = {
+        sdk: 'opencode',
+        options: { mode: 'auto', cliPath: 'opencode' }
+      };
+
+      const client = await OpenCodeInitializer.initialize({}, config) as OpenCodeClient;
+
+      const { createOpencodeClient } = await import('@opencode-ai/sdk');
+      const mockSdkClient = (createOpencodeClient as any)();
+      mockSdkClient.session.create.mockRejectedValueOnce(connectionRefused());
+      const notInstalled = () => cliProcess({ spawnError: 'ENOENT' });
+      (spawn as any).mockImplementationOnce(notInstalled).mockImplementationOnce(notInstalled);
+
+      await expect(client.generate('Hello')).rejects.toThrow('fetch failed');
+      // Still inside the retry interval, but there is nothing else to try
+      expect(await client.generate('Hello')).toBe('Server response');
+    });
+
     it('should list available providers', async () => {
       const config = {
         sdk: 'opencode',
@@ -237,6 +431,64 @@ describe('OpenCode Integration', () => {
       expect(client.getSessionId()).toBe(sessionId);
     });
 
+    it('should create a single session for concurrent calls', async () => {
+      const config = {
+        sdk: 'opencode',
+        options: { mode: 'server' }
+      };
+
+      const client = await OpenCodeInitializer.initialize({}, config) as OpenCodeClient;
+      const { createOpencodeClient } = await import('@opencode-ai/sdk');
+      const mockSdkClient = (createOpencodeClient as any)();
+
+      await Promise.all([client.generate('one'), client.generate('two'), client.generate('three')]);
+
+      expect(mockSdkClient.session.create).toHaveBeenCalledTimes(1);
+      expect(client.getSessionId()).toBe('sess-123');
+    });
+
+    it('should reject a non-numeric maxConcurrency', async () => {
+      const config = {
+        sdk: 'opencode',
+        options: { mode: 'server', maxConcurrency: 'lots' }
+      };
+
+      await expect(OpenCodeInitializer.initialize({}, config)).rejects.toThrow('Invalid maxConcurrency');
+      expect(() => new OpenCodeClient({ maxConcurrency: 0 })).toThrow('Invalid maxConcurrency');
+    });
+
+    it('should cap prompts in flight at maxConcurrency', async () => {
+      const config = {
+        sdk: 'opencode',
+        options: { mode: 'server', maxConcurrency: 2 }
+      };
+
+      const client = await OpenCodeInitializer.initialize({}, config) as OpenCodeClient;
+      const { createOpencodeClient } = await import('@opencode-ai/sdk');
+      const mockSdkClient = (createOpencodeClient as any)();
+
+      const pending: Array<() => void> = [];
+      const deferred = () =>
+        new Promise((resolve) => {
+          pending.push(() => resolve({ data: { text: 'ok' }, error: null }));
+        });
+      mockSdkClient.session.prompt
+        .mockImplementationOnce(deferred)
+        .mockImplementationOnce(deferred)
+        .mockImplementationOnce(deferred);
+
+      const calls = Promise.all([client.generate('one'), client.generate('two'), client.generate('three')]);
+      await new Promise((resolve) => setTimeout(resolve, 0));
+      expect(mockSdkClient.session.prompt).toHaveBeenCalledTimes(2);
+
+      pending.shift()!();
+      await new Promise((resolve) => setTimeout(resolve, 0));
+      expect(mockSdkClient.session.prompt).toHaveBeenCalledTimes(3);
+
+      while (pending.length) pending.shift()!();
+      expect(await calls).toEqual(['ok', 'ok', 'ok']);
+    });
+
     it('should return OpenAI-compatible chat.completions via server', async () => {
       const config = {
         sdk: 'opencode',